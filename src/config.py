@@ -1,8 +1,10 @@
 """Configuration management with environment variable support."""
 
+import functools
 import os
-from configparser import ConfigParser
-from typing import Optional, List, Dict, Any, Tuple
+import re
+from configparser import ConfigParser, InterpolationError
+from typing import Optional, Dict, Any, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -14,6 +16,22 @@ DEFAULT_VOLT_THRESHOLDS = "0.95,1.1,1.3"
 DEFAULT_VR_TEMP_THRESHOLDS = "65,75,80"
 DEFAULT_UPDATE_INTERVAL = 30
 
+# AxeOS status endpoint of a device, stored per device as 'status_url'
+DEVICE_STATUS_URL = "http://{ip}/api/system/info"
+
+# Environment variables configuring devices: DEVICE_<NAME>_IP, DEVICE_<NAME>_TEMP_THRESHOLDS, ...
+DEVICE_ENV_PREFIX = "DEVICE_"
+# Matches the part after DEVICE_ of an IP variable and captures the device name
+_DEVICE_IP_RE = re.compile(r"(.+)_IP")
+
+# Per-device threshold settings: (config key, environment variable suffix, default)
+_DEVICE_THRESHOLD_SETTINGS = (
+    ('temp_thresholds', '_TEMP_THRESHOLDS', DEFAULT_TEMP_THRESHOLDS),
+    ('fan_thresholds', '_FAN_THRESHOLDS', DEFAULT_FAN_THRESHOLDS),
+    ('volt_thresholds', '_VOLT_THRESHOLDS', DEFAULT_VOLT_THRESHOLDS),
+    ('vr_temp_thresholds', '_VR_TEMP_THRESHOLDS', DEFAULT_VR_TEMP_THRESHOLDS),
+)
+
 
 class Config:
     """Configuration loader with environment variable fallback.
@@ -30,18 +48,38 @@ class Config:
     def __init__(self) -> None:
         """Initialize configuration loader."""
         self.config = ConfigParser()
+        self._devices_cache: Optional[Dict[str, Dict[str, Any]]] = None
+        self._has_file = False
         self.project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        config_path = os.path.join(self.project_root, "config.ini")
+        self.config_path = os.path.join(self.project_root, "config.ini")
+        self._config_mtime = self._file_mtime()
         
         # Load config file if exists
-        if os.path.exists(config_path):
-            try:
-                self.config.read(config_path)
-                logger.info(f"Configuration loaded from {config_path}")
-            except Exception as e:
-                logger.error(f"Error loading config file: {e}")
+        if self._config_mtime is not None:
+            self._read_file()
         else:
-            logger.warning(f"No config.ini found at {config_path}, using environment variables only")
+            logger.warning("No config.ini found at %s, using environment variables only", self.config_path)
+    
+    def _file_mtime(self) -> Optional[int]:
+        """Get the modification time of config.ini.
+        
+        Returns:
+            st_mtime_ns of the config file, or None if it does not exist
+        """
+        try:
+            return os.stat(self.config_path).st_mtime_ns
+        except OSError:
+            return None
+    
+    def _read_file(self) -> None:
+        """Read config.ini into a fresh ConfigParser."""
+        self.config = ConfigParser()
+        self._has_file = False
+        try:
+            self._has_file = bool(self.config.read(self.config_path))
+            logger.info("Configuration loaded from %s", self.config_path)
+        except Exception as e:
+            logger.error("Error loading config file: %s", e)
     
     def get(self, section: str, key: str, fallback: Any = None, env_var: Optional[str] = None) -> Any:
         """Get config value with environment variable fallback.
@@ -56,13 +94,17 @@ class Config:
             Configuration value or fallback
         """
         # Check environment variable first
-        if env_var and os.getenv(env_var):
-            return os.getenv(env_var)
+        env_value = os.environ.get(env_var) if env_var else None
+        if env_value:
+            return env_value
         
         # Fall back to config file
+        if not self._has_file:
+            return fallback
         try:
-            return self.config.get(section, key)
-        except:
+            return self.config.get(section, key, fallback=fallback)
+        except InterpolationError as e:
+            logger.warning("Invalid value for [%s] %s: %s, using fallback", section, key, e)
             return fallback
     
     def getint(self, section: str, key: str, fallback: int = 0, env_var: Optional[str] = None) -> int:
@@ -78,17 +120,21 @@ class Config:
             Integer configuration value or fallback
         """
         # Check environment variable first
-        if env_var and os.getenv(env_var):
+        env_value = os.environ.get(env_var) if env_var else None
+        if env_value:
             try:
-                return int(os.getenv(env_var))
+                return int(env_value)
             except ValueError:
-                logger.warning(f"Invalid integer in {env_var}, using fallback")
+                logger.warning("Invalid integer in %s, using fallback", env_var)
                 pass
         
         # Fall back to config file
+        if not self._has_file:
+            return fallback
         try:
-            return self.config.getint(section, key)
-        except:
+            return self.config.getint(section, key, fallback=fallback)
+        except (ValueError, InterpolationError) as e:
+            logger.warning("Invalid integer for [%s] %s: %s, using fallback", section, key, e)
             return fallback
     
     def get_devices(self) -> Dict[str, Dict[str, Any]]:
@@ -96,6 +142,7 @@ class Config:
         
         Devices can be configured in config.ini or via environment variables.
         Environment variable format: DEVICE_<NAME>_<SETTING>
+        The result is built once and cached; call reload() to rebuild it.
         
         Returns:
             Dictionary mapping device names to their configuration
@@ -104,37 +151,82 @@ class Config:
             >>> config.get_devices()
             {'bitaxe-gamma': {'ip': '192.168.1.100', 'temp_thresholds': '60,65,70', ...}}
         """
+        if self._devices_cache is None:
+            self._devices_cache = self._build_devices()
+        return self._devices_cache
+    
+    def reload(self) -> None:
+        """Invalidate the cached device configuration.
+        
+        The next call to get_devices() rebuilds it from config.ini and the environment.
+        """
+        self._devices_cache = None
+    
+    def refresh_if_changed(self) -> bool:
+        """Re-read config.ini if its modification time changed since it was last read.
+        
+        A changed file also invalidates the cached device configuration.
+        
+        Returns:
+            True if the file was added, changed or removed since the last check
+        """
+        mtime = self._file_mtime()
+        if mtime == self._config_mtime:
+            return False
+        self._config_mtime = mtime
+        if mtime is None:
+            self.config = ConfigParser()
+            self._has_file = False
+            logger.warning("config.ini at %s was removed, using environment variables only", self.config_path)
+        else:
+            self._read_file()
+        self.reload()
+        return True
+    
+    def _build_devices(self) -> Dict[str, Dict[str, Any]]:
+        """Build the device configuration from config.ini and environment variables.
+        
+        Returns:
+            Dictionary mapping device names to their configuration
+        """
         devices = {}
         
         # First, load from config file
-        for section in self.config.sections():
-            if section != "Bot":
-                devices[section] = {
-                    'ip': self.config.get(section, 'ip'),
-                    'temp_thresholds': self.config.get(section, 'temp_thresholds', fallback=DEFAULT_TEMP_THRESHOLDS),
-                    'fan_thresholds': self.config.get(section, 'fan_thresholds', fallback=DEFAULT_FAN_THRESHOLDS),
-                    'volt_thresholds': self.config.get(section, 'volt_thresholds', fallback=DEFAULT_VOLT_THRESHOLDS),
-                    'vr_temp_thresholds': self.config.get(section, 'vr_temp_thresholds', fallback=DEFAULT_VR_TEMP_THRESHOLDS),
-                }
+        if self._has_file:
+            config_get = self.config.get
+            for section in self.config.sections():
+                if section != "Bot":
+                    device = {'ip': config_get(section, 'ip')}
+                    for key, _, default in _DEVICE_THRESHOLD_SETTINGS:
+                        device[key] = config_get(section, key, fallback=default)
+                    devices[section] = device
         
         # Then, check for environment variable overrides
         # Format: DEVICE_<name>_IP, DEVICE_<name>_TEMP_THRESHOLDS, etc.
-        for env_key, env_value in os.environ.items():
-            if env_key.startswith('DEVICE_') and '_IP' in env_key:
-                # Extract device name
-                device_name = env_key.replace('DEVICE_', '').replace('_IP', '').lower().replace('_', '-')
+        # Collect DEVICE_* variables in one pass, keyed without the "DEVICE_" prefix
+        device_env = {
+            env_key[len(DEVICE_ENV_PREFIX):]: env_value
+            for env_key, env_value in os.environ.items()
+            if env_key.startswith(DEVICE_ENV_PREFIX)
+        }
+        env_get = device_env.get
+        for env_key, env_value in device_env.items():
+            # Extract device name
+            match = _DEVICE_IP_RE.fullmatch(env_key)
+            if match:
+                name = match.group(1)
+                device_name = name.lower().replace('_', '-')
                 
-                if device_name not in devices:
-                    devices[device_name] = {}
-                
-                devices[device_name]['ip'] = env_value
-                
-                # Look for other settings for this device
-                prefix = f"DEVICE_{env_key.split('_IP')[0].replace('DEVICE_', '')}_"
-                devices[device_name]['temp_thresholds'] = os.getenv(f"{prefix}TEMP_THRESHOLDS", DEFAULT_TEMP_THRESHOLDS)
-                devices[device_name]['fan_thresholds'] = os.getenv(f"{prefix}FAN_THRESHOLDS", DEFAULT_FAN_THRESHOLDS)
-                devices[device_name]['volt_thresholds'] = os.getenv(f"{prefix}VOLT_THRESHOLDS", DEFAULT_VOLT_THRESHOLDS)
-                devices[device_name]['vr_temp_thresholds'] = os.getenv(f"{prefix}VR_TEMP_THRESHOLDS", DEFAULT_VR_TEMP_THRESHOLDS)
+                # Merge into an existing config.ini entry, looking up other settings for this device
+                device = devices.setdefault(device_name, {})
+                device['ip'] = env_value
+                for key, suffix, default in _DEVICE_THRESHOLD_SETTINGS:
+                    device[key] = env_get(name + suffix, default)
+        
+        # Build each status URL once here instead of on every poll
+        for device in devices.values():
+            if device.get('ip'):
+                device['status_url'] = DEVICE_STATUS_URL.format(ip=device['ip'])
         
         return devices
     
@@ -148,64 +240,102 @@ class Config:
         return self.project_root
 
 
-# Global config instance
-_config = Config()
+# Global config instance, created on first use so importing this module does no file I/O
+_config: Optional[Config] = None
+
+
+def _get_config() -> Config:
+    """Get the global config instance, loading it on first call.
+    
+    Returns:
+        Shared Config instance
+    """
+    global _config
+    if _config is None:
+        _config = Config()
+    return _config
 
 
 # Bot Configuration
+@functools.lru_cache(maxsize=1)
 def get_bot_token() -> str:
     """Get Discord bot token from config or environment.
     
     Returns:
         Discord bot token string
     """
-    return _config.get("Bot", "token", env_var="DISCORD_BOT_TOKEN", fallback="")
+    return _get_config().get("Bot", "token", env_var="DISCORD_BOT_TOKEN", fallback="")
 
 
+@functools.lru_cache(maxsize=1)
 def get_channel_id() -> int:
     """Get Discord channel ID from config or environment.
     
     Returns:
         Discord channel ID as integer
     """
-    return _config.getint("Bot", "channel_id", env_var="DISCORD_CHANNEL_ID", fallback=0)
+    return _get_config().getint("Bot", "channel_id", env_var="DISCORD_CHANNEL_ID", fallback=0)
 
 
+@functools.lru_cache(maxsize=1)
 def get_update_interval() -> int:
     """Get update interval in seconds from config or environment.
     
     Returns:
         Update interval in seconds (default: 30)
     """
-    return _config.getint("Bot", "update_interval", env_var="UPDATE_INTERVAL", fallback=DEFAULT_UPDATE_INTERVAL)
+    return _get_config().getint("Bot", "update_interval", env_var="UPDATE_INTERVAL", fallback=DEFAULT_UPDATE_INTERVAL)
 
 
+@functools.lru_cache(maxsize=1)
 def get_mention_user_id() -> Optional[str]:
     """Get user ID to mention on new records.
     
     Returns:
         User ID string or None if not configured
     """
-    value = _config.get("Bot", "mention_user_id", env_var="MENTION_USER_ID", fallback=None)
+    value = _get_config().get("Bot", "mention_user_id", env_var="MENTION_USER_ID", fallback=None)
     return value if value else None
 
 
+@functools.lru_cache(maxsize=1)
 def get_project_root() -> str:
     """Get project root directory.
     
     Returns:
         Absolute path to project root
     """
-    return _config.project_root_path
+    return _get_config().project_root_path
+
+
+def clear_config_cache() -> None:
+    """Clear memoized settings so the next call re-reads config and environment.
+    
+    Mainly useful for tests that patch environment variables.
+    """
+    get_bot_token.cache_clear()
+    get_channel_id.cache_clear()
+    get_update_interval.cache_clear()
+    get_mention_user_id.cache_clear()
+    get_project_root.cache_clear()
+    get_device_thresholds.cache_clear()
+    if _config is not None:
+        _config.reload()
 
 
 def get_devices() -> Dict[str, Dict[str, Any]]:
     """Get all configured devices.
     
+    The device configuration is cached and rebuilt only when config.ini changes
+    (checked via its modification time) or after clear_config_cache().
+    
     Returns:
         Dictionary mapping device names to their configuration
     """
-    return _config.get_devices()
+    config = _get_config()
+    if config.refresh_if_changed():
+        get_device_thresholds.cache_clear()
+    return config.get_devices()
 
 
 def get_device_config(device_name: str, key: str, fallback: str = "") -> str:
@@ -223,3 +353,37 @@ def get_device_config(device_name: str, key: str, fallback: str = "") -> str:
     if device_name in devices:
         return devices[device_name].get(key, fallback)
     return fallback
+
+
+def _parse_thresholds(key: str, value: str) -> Tuple[float, ...]:
+    """Parse a comma-separated threshold string; voltages are floats, all others ints."""
+    convert = float if key == 'volt_thresholds' else int
+    return tuple(convert(part) for part in value.split(','))
+
+
+@functools.lru_cache(maxsize=None)
+def get_device_thresholds(device_name: str) -> Dict[str, Tuple[float, ...]]:
+    """Get parsed alert thresholds for a device.
+    
+    Thresholds are parsed once per device and cached; clear_config_cache() resets them.
+    Invalid values fall back to the global defaults.
+    
+    Args:
+        device_name: Name of the device
+        
+    Returns:
+        Dictionary mapping threshold keys (e.g. 'temp_thresholds') to tuples of numbers
+        
+    Examples:
+        >>> get_device_thresholds('bitaxe-gamma')['temp_thresholds']
+        (60, 65, 70)
+    """
+    device_config = get_devices().get(device_name, {})
+    thresholds = {}
+    for key, _, default in _DEVICE_THRESHOLD_SETTINGS:
+        try:
+            thresholds[key] = _parse_thresholds(key, device_config.get(key, default))
+        except (ValueError, AttributeError) as e:
+            logger.warning("Invalid %s for %s: %s, using defaults", key, device_name, e)
+            thresholds[key] = _parse_thresholds(key, default)
+    return thresholds
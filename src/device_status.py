@@ -6,126 +6,431 @@ mining devices via their HTTP APIs with caching support.
 
 import asyncio
 import aiohttp
+import json
 import logging
-from typing import Dict, Any, Optional, List, Union
-from datetime import datetime, timedelta
-from src.config import get_devices
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple, Union
+from src.config import DEVICE_STATUS_URL, get_devices, get_update_interval
 
 logger = logging.getLogger(__name__)
 
+# orjson decodes the device responses considerably faster; fall back to the stdlib if missing
+_json_loads: Callable[[bytes], Any]
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - depends on the installed packages
+    _json_loads = json.loads
+
 # Caching configuration
-STATUS_CACHE: Dict[str, Dict[str, Any]] = {}
-CACHE_TTL = timedelta(seconds=5)  # Cache for 5 seconds
+# hostname -> (unified status, event loop time of the fetch)
+STATUS_CACHE: Dict[str, Tuple[Dict[str, Any], float]] = {}
+CACHE_TTL = 5.0  # Cache for 5 seconds
+CACHE_STALE_TTL = 2 * CACHE_TTL  # Serve stale data while refreshing in the background up to this age
+# Error entries go stale sooner (capped at half the update interval); past that they are served
+# stale for up to get_error_stale_ttl() while a background fetch retries, so an offline device
+# does not hold up a tick of the update loop on its timeout
+ERROR_CACHE_TTL = 2.0
+
+# hostname -> task fetching and storing its status; concurrent callers await the same task
+_inflight: Dict[str, "asyncio.Task[None]"] = {}
+
+# hostname -> unified status, kept in step with STATUS_CACHE and handed out read-only
+_STATUS_VIEW: Dict[str, Dict[str, Any]] = {}
+_STATUS_VIEW_PROXY: Mapping[str, Dict[str, Any]] = MappingProxyType(_STATUS_VIEW)
+_view_devices: Optional[Dict[str, Dict[str, Any]]] = None
+
+
+def get_error_stale_ttl() -> float:
+    """Get the age up to which cached error entries are served stale while retrying.
+    
+    The bot polls once per update interval, so entries are about that old at
+    every tick; the window covers one interval plus CACHE_TTL of slack. Healthy
+    entries use the much shorter CACHE_STALE_TTL so the loop shows fresh data.
+    
+    Returns:
+        Maximum age in seconds of an error entry served stale
+    """
+    return get_update_interval() + CACHE_TTL
+
+
+def clear_status_cache() -> None:
+    """Drop all cached device statuses."""
+    STATUS_CACHE.clear()
+    _STATUS_VIEW.clear()
+    _inflight.clear()
+
 
+# Shared HTTP session so connections to the devices are reused across polls
+_session: Optional[aiohttp.ClientSession] = None
 
-async def fetch_status(ip: str) -> Dict[str, Any]:
+
+def _get_session() -> aiohttp.ClientSession:
+    """Return the shared HTTP session, creating it on first use.
+    
+    Returns:
+        Open aiohttp client session with a pooled connector
+    """
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=5),
+        )
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared HTTP session, if one was created."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
+async def fetch_status(url: str) -> Dict[str, Any]:
     """Fetch status from a BitAxe/NerdAxe device.
     
+    The body is decoded without checking the Content-Type header, so a
+    non-JSON answer (e.g. an HTML error page) raises ValueError rather than
+    aiohttp.ContentTypeError.
+    
     Args:
-        ip: IP address of the device
+        url: Status URL of the device (the 'status_url' of its config)
         
     Returns:
-        Dictionary containing device status or error information
+        Dictionary containing device status
+        
+    Raises:
+        asyncio.TimeoutError: If the device does not answer in time
+        aiohttp.ClientError: On connection or HTTP errors
+        ValueError: If the response is not valid JSON
         
     Examples:
-        >>> status = await fetch_status("192.168.1.100")
+        >>> status = await fetch_status("http://192.168.1.100/api/system/info")
         >>> print(status.get('ASICModel'))
     """
-    try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"http://{ip}/api/system/info", timeout=aiohttp.ClientTimeout(total=5)) as response:
-                logger.debug(f"Successfully fetched data from {ip}")
-                return await response.json()
-    except asyncio.TimeoutError:
-        logger.error(f"Timeout fetching from {ip}")
+    async with _get_session().get(url) as response:
+        body = await response.read()
+        logger.debug("Successfully fetched data from %s", url)
+        return _json_loads(body)
+
+
+def _error_status(ip: str, error: BaseException) -> Dict[str, Any]:
+    """Log a failed fetch and build the error status stored for the device.
+    
+    Args:
+        ip: IP address of the device
+        error: Exception raised by fetch_status
+        
+    Returns:
+        Dictionary with a single "error" entry
+    """
+    if isinstance(error, asyncio.TimeoutError):
+        logger.error("Timeout fetching from %s", ip)
         return {"error": "timeout"}
-    except aiohttp.ClientError as e:
-        logger.error(f"Client error fetching from {ip}: {e}")
-        return {"error": str(e)}
+    if isinstance(error, aiohttp.ClientError):
+        logger.error("Client error fetching from %s: %s", ip, error)
+    else:
+        logger.error("Unexpected error fetching from %s: %s", ip, error)
+    return {"error": str(error)}
+
+
+def _store_status(hostname: str, ip: str, data: Union[Dict[str, Any], Exception], fetched_at: float) -> None:
+    """Unify a fetch result and store it in the status cache.
+    
+    Args:
+        hostname: Device name
+        ip: IP address the data was fetched from
+        data: Raw API response, or the exception raised by fetch_status
+        fetched_at: Event loop time of the fetch
+    """
+    if isinstance(data, Exception):
+        data = _error_status(ip, data)
+    unified = unify_status(data, hostname)
+    STATUS_CACHE[hostname] = (unified, fetched_at)
+    _STATUS_VIEW[hostname] = unified
+
+
+async def _fetch_and_store(hostname: str, ip: str, url: str) -> None:
+    """Fetch a device status and store it in the status cache.
+    
+    The result is dropped if the device was removed from the cache in the
+    meantime (config reload or clear_status_cache).
+    
+    Args:
+        hostname: Device name
+        ip: IP address of the device
+        url: Status URL of the device
+    """
+    try:
+        data: Union[Dict[str, Any], Exception] = await fetch_status(url)
     except Exception as e:
-        logger.error(f"Unexpected error fetching from {ip}: {e}")
-        return {"error": str(e)}
+        data = e
+    if _inflight.get(hostname) is asyncio.current_task():
+        _store_status(hostname, ip, data, asyncio.get_running_loop().time())
 
 
-async def get_all_device_statuses() -> Dict[str, Dict[str, Any]]:
+def _start_fetch(hostname: str, device_config: Dict[str, Any]) -> "asyncio.Task[None]":
+    """Start fetching a device status unless a fetch for it is already in flight.
+    
+    Args:
+        hostname: Device name
+        device_config: Device configuration with 'ip' and usually 'status_url'
+        
+    Returns:
+        The task fetching the device, shared by all concurrent callers
+    """
+    task = _inflight.get(hostname)
+    if task is None:
+        ip = device_config['ip']
+        url = device_config.get('status_url') or DEVICE_STATUS_URL.format(ip=ip)
+        task = asyncio.create_task(_fetch_and_store(hostname, ip, url))
+        _inflight[hostname] = task
+        
+        def _done(finished: "asyncio.Task[None]") -> None:
+            if _inflight.get(hostname) is finished:
+                del _inflight[hostname]
+        
+        task.add_done_callback(_done)
+    return task
+
+
+async def get_all_device_statuses() -> Mapping[str, Dict[str, Any]]:
     """Fetch status from all configured devices with caching.
     
+    Entries younger than CACHE_TTL (ERROR_CACHE_TTL for error entries) are
+    served from the cache. Entries up to CACHE_STALE_TTL old are served stale
+    while a background refresh updates them; anything older is refetched
+    before returning. Error entries are served stale for up to
+    get_error_stale_ttl(), so an offline device never blocks a tick of the
+    update loop. Concurrent callers share one in-flight fetch per device.
+    
     Returns:
-        Dictionary mapping device names to their unified status data
+        Read-only live mapping of device names to their unified status data
         
     Examples:
         >>> statuses = await get_all_device_statuses()
         >>> for name, status in statuses.items():
         ...     print(f"{name}: {status.get('hashRate')}")
     """
-    global STATUS_CACHE
+    global _view_devices
     
     devices = get_devices()
     tasks = []
-    hostnames = []
+    now = asyncio.get_running_loop().time()
+    error_ttl = min(ERROR_CACHE_TTL, get_update_interval() / 2)
+    error_stale_ttl = get_error_stale_ttl()
     
     for hostname, device_config in devices.items():
         if device_config.get('ip'):
             # Check cache
-            if hostname in STATUS_CACHE:
-                cache_entry = STATUS_CACHE[hostname]
-                if datetime.now() - cache_entry['timestamp'] < CACHE_TTL:
-                    logger.debug(f"Using cached status for {hostname}")
+            cache_entry = STATUS_CACHE.get(hostname)
+            if cache_entry is not None:
+                age = now - cache_entry[1]
+                if "error" in cache_entry[0]:
+                    fresh_ttl, stale_ttl = error_ttl, error_stale_ttl
+                else:
+                    fresh_ttl, stale_ttl = CACHE_TTL, CACHE_STALE_TTL
+                if age < fresh_ttl:
+                    logger.debug("Using cached status for %s", hostname)
+                    continue
+                if age < stale_ttl:
+                    logger.debug("Using stale status for %s, refreshing in background", hostname)
+                    _start_fetch(hostname, device_config)
                     continue
             
-            hostnames.append(hostname)
-            tasks.append(fetch_status(device_config['ip']))
+            tasks.append(_start_fetch(hostname, device_config))
     
-    # Fetch new data
+    # Fetch new data; shielded so a cancelled caller does not cancel fetches other callers await
     if tasks:
-        results = await asyncio.gather(*tasks)
-        for hostname, data in zip(hostnames, results):
-            unified = unify_status(data, hostname)
-            STATUS_CACHE[hostname] = {
-                'data': unified,
-                'timestamp': datetime.now()
-            }
+        await asyncio.gather(*(asyncio.shield(task) for task in tasks))
+    
+    # get_devices() returns a new dict only after a config reload; drop removed devices then
+    if devices is not _view_devices:
+        for name in [name for name in _STATUS_VIEW if name not in devices]:
+            del _STATUS_VIEW[name]
+            STATUS_CACHE.pop(name, None)
+            _inflight.pop(name, None)
+        _view_devices = devices
     
     # Return all cached data
-    return {name: STATUS_CACHE[name]['data'] for name in devices.keys() if name in STATUS_CACHE}
+    return _STATUS_VIEW_PROXY
 
 
-def get_value(data: Dict[str, Any], keys: List[str]) -> Optional[Any]:
+def get_value(data: Dict[str, Any], keys: Sequence[str]) -> Optional[Any]:
     """Get value from data dict, supporting nested keys.
     
     Args:
         data: Dictionary to search in
-        keys: List of keys, either alternatives or nested path
+        keys: Tuple or list of keys, either alternatives or nested path
         
     Returns:
         Value if found, None otherwise
         
     Examples:
         >>> data = {"stratum": {"poolMode": "solo"}}
-        >>> get_value(data, ["stratum", "poolMode"])
+        >>> get_value(data, ("stratum", "poolMode"))
         'solo'
-        >>> get_value(data, ["power", "voltage"])  # Try alternatives
+        >>> get_value(data, ("power", "voltage"))  # Try alternatives
         None
     """
     if not keys:
         return None
     
-    # Check if this is a nested path (multi-element list where first element is a dict in data)
-    if len(keys) > 1 and keys[0] in data and isinstance(data.get(keys[0]), dict):
-        current = data
-        for k in keys:
-            if isinstance(current, dict) and k in current:
-                current = current[k]
-            else:
+    # Fast path: a single key is a plain lookup
+    if len(keys) == 1:
+        return data.get(keys[0])
+    
+    # Check if this is a nested path (multi-element sequence where first element is a dict in data)
+    current = data.get(keys[0])
+    if isinstance(current, dict):
+        for k in keys[1:]:
+            if not isinstance(current, dict):
                 return None
+            current = current.get(k)
         return current
     
-    # Otherwise, try each key as an alternative
+    # Otherwise, try each key as an alternative (a present None still wins)
     for key in keys:
-        if key in data:
-            return data[key]
+        value = data.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
     return None
 
+
+# Marks an absent key where None is a valid value
+_MISSING = object()
+
+# Shared immutable default for list-valued fields; copy before mutating
+_EMPTY: Tuple[Any, ...] = ()
+
+# Unified status schema, compiled once at import time.
+# Basierend auf AxeOS-HA-Integration Sensor-Definitionen.
+# (output key, alternative API keys, default) - first present key wins
+_STATUS_FIELDS = (
+    # Basic Info
+    ("deviceID", ("deviceID",), "N/A"),
+    ("ip", ("ip", "hostip"), "N/A"),
+    ("mac", ("macAddr", "mac"), "N/A"),
+
+    # Power & Performance
+    ("power", ("power",), 0.0),
+    ("powerLimit", ("powerLimit",), 0.0),
+    ("maxPower", ("maxPower",), 0.0),
+    ("minPower", ("minPower",), 0.0),
+    ("voltage", ("voltage",), 0),
+    ("current", ("current",), 0),
+    ("maxVoltage", ("maxVoltage",), 0),
+    ("minVoltage", ("minVoltage",), 0),
+    ("nominalVoltage", ("nominalVoltage",), 0),
+
+    # Hashrate Metrics (inkl. erweiterte NerdAxe Metriken)
+    ("hashRate", ("hashRate",), 0.0),
+    ("hashRate_1m", ("hashRate_1m",), 0.0),
+    ("hashRate_10m", ("hashRate_10m",), 0.0),
+    ("hashRate_1h", ("hashRate_1h",), 0.0),
+    ("hashRate_1d", ("hashRate_1d",), 0.0),
+    ("expectedHashrate", ("expectedHashrate",), 0.0),
+
+    # Temperature
+    ("temp", ("temp",), 0),
+    ("vrTemp", ("vrTemp",), 0),
+    ("temptarget", ("temptarget", "pidTargetTemp"), 0),
+    ("overheat_temp", ("overheat_temp",), 0),
+
+    # Mining Statistics
+    ("bestDiff", ("bestDiff",), "-"),
+    ("bestSessionDiff", ("bestSessionDiff",), "-"),
+    ("bestDiffTime", ("bestDiffTime",), "-"),
+    ("poolDifficulty", ("poolDifficulty",), 0),
+    ("stratumDifficulty", ("stratumDifficulty",), 0),
+    ("sharesAccepted", ("sharesAccepted",), 0),
+    ("sharesRejected", ("sharesRejected",), 0),
+    ("sharesRejectedReasons", ("sharesRejectedReasons",), _EMPTY),
+
+    # Voltage & Frequency
+    ("coreVoltage", ("coreVoltage",), 0),
+    ("defaultCoreVoltage", ("defaultCoreVoltage",), 0),
+    ("coreVoltageActual", ("coreVoltageActual", "coreVoltageActualMV"), 0),
+    ("coreVoltageSet", ("coreVoltageSet",), 0),
+    ("frequency", ("frequency",), 0),
+
+    # Network
+    ("ssid", ("ssid",), "-"),
+    ("wifiStatus", ("wifiStatus",), "-"),
+    ("wifiRSSI", ("wifiRSSI",), 0),
+
+    # Hardware Info
+    ("ASICModel", ("ASICModel",), "Unknown"),
+    ("deviceModel", ("deviceModel", "boardVersion"), "Unknown"),
+    ("asicCount", ("asicCount",), 0),
+    ("smallCoreCount", ("smallCoreCount",), 0),
+
+    # Fan Control
+    ("fanspeed", ("fanspeed",), 0),
+    ("fanrpm", ("fanrpm",), 0),
+    ("manualFanSpeed", ("manualFanSpeed",), 0),
+
+    # System Info
+    ("uptimeSeconds", ("uptimeSeconds",), 0),
+    ("freeHeap", ("freeHeap",), 0),
+    ("freeHeapInt", ("freeHeapInt",), 0),
+    ("version", ("version",), "N/A"),
+    ("axeOSVersion", ("axeOSVersion",), "N/A"),
+    ("idfVersion", ("idfVersion",), "N/A"),
+    ("boardVersion", ("boardVersion", "deviceModel"), "Unknown"),
+
+    # Stratum
+    ("stratumURL", ("stratumURL",), "-"),
+    ("stratumPort", ("stratumPort",), "-"),
+    ("stratumUser", ("stratumUser",), "-"),
+    ("fallbackStratumURL", ("fallbackStratumURL",), "-"),
+    ("fallbackStratumPort", ("fallbackStratumPort",), "-"),
+    ("fallbackStratumUser", ("fallbackStratumUser",), "-"),
+    ("isUsingFallbackStratum", ("isUsingFallbackStratum", "stratum.usingFallback"), False),
+
+    # NerdAxe Specific
+    ("duplicateHWNonces", ("duplicateHWNonces",), 0),
+    ("foundBlocks", ("foundBlocks",), 0),
+    ("totalFoundBlocks", ("totalFoundBlocks",), 0),
+    ("defaultFrequency", ("defaultFrequency",), 0),
+    ("vrFrequency", ("vrFrequency",), 0),
+    ("defaultVrFrequency", ("defaultVrFrequency",), 0),
+    ("jobInterval", ("jobInterval",), 0),
+    ("lastResetReason", ("lastResetReason",), "N/A"),
+    ("runningPartition", ("runningPartition",), "N/A"),
+
+    # PID Controller Values (NerdAxe)
+    ("pidP", ("pidP",), 0),
+    ("pidI", ("pidI",), 0),
+    ("pidD", ("pidD",), 0),
+
+    # Binary Sensor Values
+    ("overheat_mode", ("overheat_mode",), False),
+    ("autofanspeed", ("autofanspeed",), False),
+    ("invertfanpolarity", ("invertfanpolarity",), False),
+    ("flipscreen", ("flipscreen",), False),
+    ("invertscreen", ("invertscreen",), False),
+)
+
+# (output key, nested API path, default) - falls back to flat keys if the parent is missing
+_NESTED_STATUS_FIELDS = (
+    # Stratum Pool Details (verschachtelt für NerdAxe)
+    ("stratum_poolMode", ("stratum", "poolMode"), "-"),
+    ("stratum_activePoolMode", ("stratum", "activePoolMode"), "-"),
+    ("stratum_poolBalance", ("stratum", "poolBalance"), 0),
+    ("stratum_totalBestDiff", ("stratum", "totalBestDiff"), 0),
+    ("stratum_poolDifficulty", ("stratum", "poolDifficulty"), 0),
+)
+
+# Most fields read a single API key; split them out so they need one dict.get each
+_SIMPLE_STATUS_FIELDS = tuple(
+    (out_key, keys[0], default) for out_key, keys, default in _STATUS_FIELDS if len(keys) == 1
+)
+_ALIASED_STATUS_FIELDS = tuple(field for field in _STATUS_FIELDS if len(field[1]) > 1)
+
+
 def unify_status(data: Dict[str, Any], hostname: str) -> Dict[str, Any]:
     """Unify BitAxe/NerdAxe API response with support for all 80+ sensors.
     
@@ -144,117 +449,26 @@ def unify_status(data: Dict[str, Any], hostname: str) -> Dict[str, Any]:
         return data
 
     # Vereinheitlichte Struktur mit Defaults für alle möglichen API-Werte
-    # Basierend auf AxeOS-HA-Integration Sensor-Definitionen
-    return {
-        # Basic Info
-        "hostname": get_value(data, ["hostname"]) or hostname,
-        "deviceID": get_value(data, ["deviceID"]) or "N/A",
-        "ip": get_value(data, ["ip", "hostip"]) or "N/A",
-        "mac": get_value(data, ["macAddr", "mac"]) or "N/A",
-        
-        # Power & Performance
-        "power": get_value(data, ["power"]) or 0.0,
-        "powerLimit": get_value(data, ["powerLimit"]) or 0.0,
-        "maxPower": get_value(data, ["maxPower"]) or 0.0,
-        "minPower": get_value(data, ["minPower"]) or 0.0,
-        "voltage": get_value(data, ["voltage"]) or 0,
-        "current": get_value(data, ["current"]) or 0,
-        "maxVoltage": get_value(data, ["maxVoltage"]) or 0,
-        "minVoltage": get_value(data, ["minVoltage"]) or 0,
-        "nominalVoltage": get_value(data, ["nominalVoltage"]) or 0,
-        
-        # Hashrate Metrics (inkl. erweiterte NerdAxe Metriken)
-        "hashRate": get_value(data, ["hashRate"]) or 0.0,
-        "hashRate_1m": get_value(data, ["hashRate_1m"]) or 0.0,
-        "hashRate_10m": get_value(data, ["hashRate_10m"]) or 0.0,
-        "hashRate_1h": get_value(data, ["hashRate_1h"]) or 0.0,
-        "hashRate_1d": get_value(data, ["hashRate_1d"]) or 0.0,
-        "expectedHashrate": get_value(data, ["expectedHashrate"]) or 0.0,
-        
-        # Temperature
-        "temp": get_value(data, ["temp"]) or 0,
-        "vrTemp": get_value(data, ["vrTemp"]) or 0,
-        "temptarget": get_value(data, ["temptarget", "pidTargetTemp"]) or 0,
-        "overheat_temp": get_value(data, ["overheat_temp"]) or 0,
-        
-        # Mining Statistics
-        "bestDiff": get_value(data, ["bestDiff"]) or "-",
-        "bestSessionDiff": get_value(data, ["bestSessionDiff"]) or "-",
-        "bestDiffTime": get_value(data, ["bestDiffTime"]) or "-",
-        "poolDifficulty": get_value(data, ["poolDifficulty"]) or 0,
-        "stratumDifficulty": get_value(data, ["stratumDifficulty"]) or 0,
-        "sharesAccepted": get_value(data, ["sharesAccepted"]) or 0,
-        "sharesRejected": get_value(data, ["sharesRejected"]) or 0,
-        "sharesRejectedReasons": get_value(data, ["sharesRejectedReasons"]) or [],
-        
-        # Voltage & Frequency
-        "coreVoltage": get_value(data, ["coreVoltage"]) or 0,
-        "defaultCoreVoltage": get_value(data, ["defaultCoreVoltage"]) or 0,
-        "coreVoltageActual": get_value(data, ["coreVoltageActual", "coreVoltageActualMV"]) or 0,
-        "coreVoltageSet": get_value(data, ["coreVoltageSet"]) or 0,
-        "frequency": get_value(data, ["frequency"]) or 0,
-        
-        # Network
-        "ssid": get_value(data, ["ssid"]) or "-",
-        "wifiStatus": get_value(data, ["wifiStatus"]) or "-",
-        "wifiRSSI": get_value(data, ["wifiRSSI"]) or 0,
-        
-        # Hardware Info
-        "ASICModel": get_value(data, ["ASICModel"]) or "Unknown",
-        "deviceModel": get_value(data, ["deviceModel", "boardVersion"]) or "Unknown",
-        "asicCount": get_value(data, ["asicCount"]) or 0,
-        "smallCoreCount": get_value(data, ["smallCoreCount"]) or 0,
-        
-        # Fan Control
-        "fanspeed": get_value(data, ["fanspeed"]) or 0,
-        "fanrpm": get_value(data, ["fanrpm"]) or 0,
-        "manualFanSpeed": get_value(data, ["manualFanSpeed"]) or 0,
-        
-        # System Info
-        "uptimeSeconds": get_value(data, ["uptimeSeconds"]) or 0,
-        "freeHeap": get_value(data, ["freeHeap"]) or 0,
-        "freeHeapInt": get_value(data, ["freeHeapInt"]) or 0,
-        "version": get_value(data, ["version"]) or "N/A",
-        "axeOSVersion": get_value(data, ["axeOSVersion"]) or "N/A",
-        "idfVersion": get_value(data, ["idfVersion"]) or "N/A",
-        "boardVersion": get_value(data, ["boardVersion", "deviceModel"]) or "Unknown",
-        
-        # Stratum
-        "stratumURL": get_value(data, ["stratumURL"]) or "-",
-        "stratumPort": get_value(data, ["stratumPort"]) or "-",
-        "stratumUser": get_value(data, ["stratumUser"]) or "-",
-        "fallbackStratumURL": get_value(data, ["fallbackStratumURL"]) or "-",
-        "fallbackStratumPort": get_value(data, ["fallbackStratumPort"]) or "-",
-        "fallbackStratumUser": get_value(data, ["fallbackStratumUser"]) or "-",
-        "isUsingFallbackStratum": get_value(data, ["isUsingFallbackStratum", "stratum.usingFallback"]) or False,
-        
-        # NerdAxe Specific
-        "duplicateHWNonces": get_value(data, ["duplicateHWNonces"]) or 0,
-        "foundBlocks": get_value(data, ["foundBlocks"]) or 0,
-        "totalFoundBlocks": get_value(data, ["totalFoundBlocks"]) or 0,
-        "defaultFrequency": get_value(data, ["defaultFrequency"]) or 0,
-        "vrFrequency": get_value(data, ["vrFrequency"]) or 0,
-        "defaultVrFrequency": get_value(data, ["defaultVrFrequency"]) or 0,
-        "jobInterval": get_value(data, ["jobInterval"]) or 0,
-        "lastResetReason": get_value(data, ["lastResetReason"]) or "N/A",
-        "runningPartition": get_value(data, ["runningPartition"]) or "N/A",
-        
-        # PID Controller Values (NerdAxe)
-        "pidP": get_value(data, ["pidP"]) or 0,
-        "pidI": get_value(data, ["pidI"]) or 0,
-        "pidD": get_value(data, ["pidD"]) or 0,
-        
-        # Stratum Pool Details (verschachtelt für NerdAxe)
-        "stratum_poolMode": get_value(data, ["stratum", "poolMode"]) or "-",
-        "stratum_activePoolMode": get_value(data, ["stratum", "activePoolMode"]) or "-",
-        "stratum_poolBalance": get_value(data, ["stratum", "poolBalance"]) or 0,
-        "stratum_totalBestDiff": get_value(data, ["stratum", "totalBestDiff"]) or 0,
-        "stratum_poolDifficulty": get_value(data, ["stratum", "poolDifficulty"]) or 0,
-        
-        # Binary Sensor Values
-        "overheat_mode": get_value(data, ["overheat_mode"]) or False,
-        "autofanspeed": get_value(data, ["autofanspeed"]) or False,
-        "invertfanpolarity": get_value(data, ["invertfanpolarity"]) or False,
-        "flipscreen": get_value(data, ["flipscreen"]) or False,
-        "invertscreen": get_value(data, ["invertscreen"]) or False,
-    }
+    data_get = data.get
+    result: Dict[str, Any] = {"hostname": data_get("hostname") or hostname}
+
+    for out_key, key, default in _SIMPLE_STATUS_FIELDS:
+        result[out_key] = data_get(key) or default
+
+    for out_key, keys, default in _ALIASED_STATUS_FIELDS:
+        for key in keys:
+            value = data_get(key, _MISSING)
+            if value is not _MISSING:
+                break
+        else:
+            value = None
+        result[out_key] = value or default
+
+    for out_key, path, default in _NESTED_STATUS_FIELDS:
+        parent = data_get(path[0])
+        if isinstance(parent, dict):
+            value = parent.get(path[1])
+        else:
+            value = get_value(data, path)
+        result[out_key] = value or default
+    return result
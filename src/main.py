@@ -6,16 +6,23 @@ to a Discord channel with automatic reconnection and error recovery.
 
 import discord
 from discord.ext import commands, tasks
+import functools
 import asyncio
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import os
 import sys
 import json
-from typing import Optional, Dict, Any
-from datetime import datetime, timedelta
-
-from src.status_overview import format_status_embeds
+import queue
+import threading
+import time
+from collections import deque
+from typing import Optional, Dict, Any, List
+from datetime import timedelta
+
+from src.status_overview import flush_best_diff, format_status_embeds
+from src.device_status import close_session, get_all_device_statuses
 from src.config import (
     get_bot_token,
     get_channel_id,
@@ -26,8 +33,9 @@ from src.config import (
 )
 
 
+@functools.lru_cache(maxsize=1)
 def get_version() -> str:
-    """Read version from VERSION file.
+    """Read version from VERSION file (once; the result is cached).
     
     Returns:
         Version string (e.g., '2.0.0') or 'unknown' if file not found
@@ -39,7 +47,7 @@ def get_version() -> str:
     except FileNotFoundError:
         return 'unknown'
     except Exception as e:
-        logger.warning(f'Error reading VERSION file: {e}')
+        logger.warning('Error reading VERSION file: %s', e)
         return 'unknown'
 
 
@@ -53,7 +61,7 @@ def load_status_message_id(message_path: str) -> Optional[int]:
             if isinstance(message_id, int):
                 return message_id
     except Exception as e:
-        logger.warning(f"Failed to load status message ID: {e}")
+        logger.warning("Failed to load status message ID: %s", e)
     return None
 
 
@@ -64,7 +72,84 @@ def save_status_message_id(message_path: str, message_id: int) -> None:
         with open(message_path, "w") as f:
             json.dump({"message_id": message_id}, f)
     except Exception as e:
-        logger.warning(f"Failed to save status message ID: {e}")
+        logger.warning("Failed to save status message ID: %s", e)
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """Rotating file handler that batches disk flushes.
+    
+    StreamHandler flushes after every record, and RotatingFileHandler seeks to
+    the end of the file for its size check, which flushes too. This handler
+    tracks the file size (in encoded bytes) itself and only flushes once
+    ``flush_lines`` records are buffered, a record of ``flush_level`` or higher
+    arrives, or ``flush_interval`` seconds have passed - a timer flushes
+    buffered records even when no further record follows. Explicit
+    flush()/close() calls (e.g. from logging.shutdown) always write everything out.
+    
+    Examples:
+        >>> handler = BufferedRotatingFileHandler("bot.log", maxBytes=5*1024*1024, backupCount=3)
+    """
+    
+    def __init__(
+        self,
+        *args: Any,
+        flush_lines: int = 256,
+        flush_interval: float = 1.0,
+        flush_level: int = logging.ERROR,
+        **kwargs: Any,
+    ) -> None:
+        self._size = 0
+        self._record_size = 0
+        super().__init__(*args, **kwargs)
+        self.flush_lines = flush_lines
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        self._buffered = 0
+        self._last_flush = time.monotonic()
+        self._in_emit = False
+        self._flush_timer: Optional[threading.Timer] = None
+    
+    def _open(self):
+        stream = super()._open()
+        self._size = os.fstat(stream.fileno()).st_size
+        return stream
+    
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if self.stream is None:
+            self.stream = self._open()
+        # Count encoded bytes, not characters: the log is full of emojis and umlauts
+        self._record_size = len(self.format(record).encode(self.encoding or "utf-8")) + 1
+        return self.maxBytes > 0 and self._size + self._record_size >= self.maxBytes
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        # Runs with self.lock held (Handler.handle)
+        self._buffered += 1
+        self._in_emit = record.levelno < self.flush_level
+        try:
+            super().emit(record)
+            self._size += self._record_size
+        finally:
+            self._in_emit = False
+        if self._buffered and self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+    
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            # StreamHandler.emit() calls flush() after each record; skip it until a batch is due
+            if self._in_emit and self._buffered < self.flush_lines and time.monotonic() - self._last_flush < self.flush_interval:
+                return
+            super().flush()
+            self._buffered = 0
+            self._last_flush = time.monotonic()
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+        finally:
+            self.release()
+
 
 # Logging configuration with rotation
 log_dir = os.path.join(get_project_root(), "logs")
@@ -74,8 +159,8 @@ log_formatter = logging.Formatter(
     '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
 )
 
-# File handler with rotation (5MB max, 3 backups)
-file_handler = RotatingFileHandler(
+# File handler with rotation (5MB max, 3 backups), flushed in batches
+file_handler = BufferedRotatingFileHandler(
     os.path.join(log_dir, "bot.log"),
     maxBytes=5*1024*1024,
     backupCount=3
@@ -88,11 +173,16 @@ console_handler = logging.StreamHandler()
 console_handler.setFormatter(log_formatter)
 console_handler.setLevel(logging.INFO)
 
+# File and console output run on a background thread so logging never blocks the event loop
+log_queue: queue.SimpleQueue = queue.SimpleQueue()
+log_listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)
+
 # Root logger
 logger = logging.getLogger()
 logger.setLevel(logging.DEBUG)
-logger.addHandler(file_handler)
-logger.addHandler(console_handler)
+logger.addHandler(QueueHandler(log_queue))
 
 # Reduce discord.py logging noise
 logging.getLogger('discord').setLevel(logging.WARNING)
@@ -109,19 +199,98 @@ last_messages: Dict[str, Optional[discord.Message]] = {
     "nerdaxe": None,
     "history": None,
 }
-last_update_time: Optional[datetime] = None
 status_cache: Dict[str, Any] = {}
-alert_cooldowns: Dict[str, datetime] = {}  # Track when alerts were last sent
+alert_cooldowns: Dict[str, float] = {}  # Track when alerts were last sent (time.monotonic())
+offline_counts: Dict[str, int] = {}  # Consecutive failed checks per currently offline device
 ALERT_COOLDOWN = timedelta(minutes=15)  # Don't spam alerts
+_ALERT_COOLDOWN_SEC = ALERT_COOLDOWN.total_seconds()
+ALERT_PRUNE_EVERY_TICKS = 1000  # Drop expired cooldown entries every N update ticks
 STATUS_MESSAGE_DIR = os.path.join(get_project_root(), "data")
-MESSAGE_EDIT_COOLDOWNS: Dict[str, datetime] = {}
+MESSAGE_EDIT_COOLDOWNS: Dict[str, float] = {}  # time.monotonic() deadline per message
 LAST_EMBED_PAYLOADS: Dict[str, Dict[str, Any]] = {}
 MIN_MESSAGE_EDIT_INTERVAL = timedelta(seconds=5)
+_MIN_MESSAGE_EDIT_INTERVAL_SEC = MIN_MESSAGE_EDIT_INTERVAL.total_seconds()
+
+
+class DiscordThrottle:
+    """Sliding-window limiter for Discord message sends and edits.
+    
+    Waits only when more than ``rate_limit`` calls were started within the last
+    ``period`` seconds, so it is a no-op while the bot stays under the limit.
+    
+    Examples:
+        >>> throttle = DiscordThrottle(rate_limit=5, period=5.0)
+        >>> async with throttle:
+        ...     await message.edit(embed=embed)
+    """
+    
+    def __init__(self, rate_limit: int, period: float) -> None:
+        """Initialize the limiter.
+        
+        Args:
+            rate_limit: Maximum number of calls per period
+            period: Window length in seconds
+        """
+        self.rate_limit = rate_limit
+        self.period = period
+        self._calls: deque = deque()
+        self._lock = asyncio.Lock()
+    
+    async def __aenter__(self) -> None:
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            while self._calls and now - self._calls[0] >= self.period:
+                self._calls.popleft()
+            if len(self._calls) >= self.rate_limit:
+                await asyncio.sleep(self.period - (now - self._calls.popleft()))
+            self._calls.append(loop.time())
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+
+# Discord allows 5 message edits/sends per 5 seconds per channel
+discord_throttle = DiscordThrottle(rate_limit=5, period=5.0)
 
 
 def get_status_message_path(message_key: str) -> str:
     return os.path.join(STATUS_MESSAGE_DIR, f"status_message_{message_key}.json")
 
+
+# Discord's maximum message length
+MAX_MESSAGE_LENGTH = 2000
+
+
+def split_message(content: str, limit: int = MAX_MESSAGE_LENGTH) -> List[str]:
+    """Split message content at line breaks into chunks Discord accepts.
+    
+    Args:
+        content: Message text, lines separated by newlines
+        limit: Maximum length of a single message
+        
+    Returns:
+        List of message texts, each at most limit characters long
+    """
+    chunks = []
+    current = ""
+    for line in content.split("\n"):
+        while len(line) > limit:
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(line[:limit])
+            line = line[limit:]
+        if current and len(current) + 1 + len(line) > limit:
+            chunks.append(current)
+            current = line
+        else:
+            current = f"{current}\n{line}" if current else line
+    if current:
+        chunks.append(current)
+    return chunks
+
+
 # Alert thresholds
 TEMP_CRITICAL = 75  # °C
 VR_TEMP_CRITICAL = 85  # °C
@@ -136,11 +305,11 @@ async def on_ready() -> None:
     It starts the periodic status update loop.
     """
     version = get_version()
-    logger.info(f'Bot connected as {bot.user} (ID: {bot.user.id})')
-    logger.info(f'Version: {version}')
-    logger.info(f'Monitoring {len(get_devices())} device(s)')
-    logger.info(f'Target channel ID: {get_channel_id()}')
-    logger.info(f'Update interval: {get_update_interval()}s')
+    logger.info('Bot connected as %s (ID: %s)', bot.user, bot.user.id)
+    logger.info('Version: %s', version)
+    logger.info('Monitoring %s device(s)', len(get_devices()))
+    logger.info('Target channel ID: %s', get_channel_id())
+    logger.info('Update interval: %ss', get_update_interval())
     
     # Set bot presence with version
     try:
@@ -150,18 +319,18 @@ async def on_ready() -> None:
                 name=f"BitAxe Devices | v{version}"
             )
         )
-        logger.info(f'Bot presence set to: Watching BitAxe Devices | v{version}')
+        logger.info('Bot presence set to: Watching BitAxe Devices | v%s', version)
     except Exception as e:
-        logger.error(f'Error setting bot presence: {e}')
+        logger.error('Error setting bot presence: %s', e)
     
     try:
         channel = bot.get_channel(get_channel_id())
         if channel:
-            logger.info(f'Found target channel: {channel.name}')
+            logger.info('Found target channel: %s', channel.name)
         else:
-            logger.error(f'Channel {get_channel_id()} not found!')
+            logger.error('Channel %s not found!', get_channel_id())
     except Exception as e:
-        logger.error(f'Error accessing channel: {e}')
+        logger.error('Error accessing channel: %s', e)
     
     if not update_status.is_running():
         update_status.start()
@@ -188,57 +357,82 @@ async def on_resumed() -> None:
     logger.info('Bot reconnected to Discord')
 
 
-async def check_and_send_alerts(channel: discord.TextChannel, device_name: str, status: Dict[str, Any]) -> None:
-    """Check device status and send alerts for critical conditions.
+def claim_alert(alert_key: str, now: float) -> bool:
+    """Check whether an alert may be sent and start its cooldown if so.
     
     Args:
-        channel: Discord channel to send alerts to
-        device_name: Name of the device being checked
-        status: Device status dictionary
+        alert_key: Cooldown key, e.g. "<device>_temp"
+        now: Current time.monotonic() value
+        
+    Returns:
+        True if the alert is not on cooldown (and is now marked as sent)
+    """
+    last_sent = alert_cooldowns.get(alert_key)
+    if last_sent is not None and now - last_sent <= _ALERT_COOLDOWN_SEC:
+        return False
+    alert_cooldowns[alert_key] = now
+    return True
+
+
+def prune_alert_cooldowns(now: float) -> None:
+    """Remove cooldown entries that have expired.
+    
+    An expired entry behaves exactly like a missing one, so this only bounds
+    the size of alert_cooldowns for devices that were renamed or removed.
+    
+    Args:
+        now: Current time.monotonic() value
     """
     global alert_cooldowns
+    alert_cooldowns = {
+        key: last_sent for key, last_sent in alert_cooldowns.items() if now - last_sent <= _ALERT_COOLDOWN_SEC
+    }
+
+
+def check_alerts(device_name: str, status: Dict[str, Any]) -> List[str]:
+    """Check device status for critical conditions.
+    
+    Alerts still on cooldown are skipped; update_status sends all returned
+    lines of a tick in a single message. Consecutive offline checks are
+    counted in offline_counts, since status dicts are rebuilt every fetch.
     
-    now = datetime.now()
+    Args:
+        device_name: Name of the device being checked
+        status: Device status dictionary
+        
+    Returns:
+        Alert lines for this device (empty if nothing to report)
+    """
+    now = time.monotonic()
     alerts = []
     
-    # Check if device is offline
-    if status.get('status') == 'Offline':
-        offline_count = status.get('_offline_count', 0) + 1
-        status['_offline_count'] = offline_count
+    # Check if device is offline (failed fetches come back as {"error": ...})
+    if 'error' in status or status.get('status') == 'Offline':
+        offline_count = offline_counts.get(device_name, 0) + 1
+        offline_counts[device_name] = offline_count
         
         if offline_count >= OFFLINE_ALERT_THRESHOLD:
             alert_key = f"{device_name}_offline"
-            if alert_key not in alert_cooldowns or (now - alert_cooldowns[alert_key]) > ALERT_COOLDOWN:
+            if claim_alert(alert_key, now):
                 alerts.append(f"⚠️ **{device_name}** ist offline! (seit {offline_count} Checks)")
-                alert_cooldowns[alert_key] = now
     else:
-        status['_offline_count'] = 0
+        offline_counts.pop(device_name, None)
     
     # Check temperature
     temp = status.get('temp')
     if temp and isinstance(temp, (int, float)) and temp >= TEMP_CRITICAL:
         alert_key = f"{device_name}_temp"
-        if alert_key not in alert_cooldowns or (now - alert_cooldowns[alert_key]) > ALERT_COOLDOWN:
+        if claim_alert(alert_key, now):
             alerts.append(f"🔥 **{device_name}** Kritische Temperatur: {temp}°C!")
-            alert_cooldowns[alert_key] = now
     
     # Check VR temperature
     vr_temp = status.get('vrTemp')
     if vr_temp and isinstance(vr_temp, (int, float)) and vr_temp >= VR_TEMP_CRITICAL:
         alert_key = f"{device_name}_vrtemp"
-        if alert_key not in alert_cooldowns or (now - alert_cooldowns[alert_key]) > ALERT_COOLDOWN:
+        if claim_alert(alert_key, now):
             alerts.append(f"🔥 **{device_name}** Kritische VR-Temperatur: {vr_temp}°C!")
-            alert_cooldowns[alert_key] = now
     
-    # Send alerts if any
-    if alerts:
-        mention = f"<@{get_mention_user_id()}>" if get_mention_user_id() else ""
-        alert_message = "\n".join(alerts)
-        try:
-            await channel.send(f"{mention}\n{alert_message}")
-            logger.warning(f"Alert sent for {device_name}: {alert_message}")
-        except discord.HTTPException as e:
-            logger.error(f"Failed to send alert: {e}")
+    return alerts
 
 
 @tasks.loop(seconds=get_update_interval())
@@ -252,34 +446,31 @@ async def update_status() -> None:
     - Updates or creates a Discord message with status embed
     - Implements rate limiting to avoid Discord API limits
     """
-    global last_messages, last_update_time, status_cache
+    global last_messages, status_cache
     
     channel = bot.get_channel(get_channel_id())
     if not channel:
-        logger.error(f"Channel {get_channel_id()} not accessible")
+        logger.error("Channel %s not accessible", get_channel_id())
         return
     
     try:
-        # Fetch device statuses (with caching in device_status module)
-        embeds, new_record_device, new_record_value = await format_status_embeds()
-        
-        # Rate limiting: Wait if we updated too recently
-        if last_update_time and (datetime.now() - last_update_time).total_seconds() < 1:
-            await asyncio.sleep(1)
+        # Fetch device statuses once per tick (with caching in device_status module)
+        all_statuses = await get_all_device_statuses()
+        embeds, new_record_device, new_record_value = await format_status_embeds(all_statuses)
         
         for message_key, embed in embeds.items():
             if embed is None:
                 continue
             message_path = get_status_message_path(message_key)
             last_message = last_messages.get(message_key)
-            now = datetime.now()
+            now = time.monotonic()
 
             cooldown_until = MESSAGE_EDIT_COOLDOWNS.get(message_key)
             if cooldown_until and now < cooldown_until:
                 logger.debug(
-                    "Skipping update for %s due to rate-limit cooldown until %s",
+                    "Skipping update for %s due to rate-limit cooldown (%.1fs left)",
                     message_key,
-                    cooldown_until.isoformat(),
+                    cooldown_until - now,
                 )
                 continue
 
@@ -289,7 +480,7 @@ async def update_status() -> None:
                 continue
 
             last_update_for_message = status_cache.get(f"last_update_{message_key}")
-            if last_update_for_message and now - last_update_for_message < MIN_MESSAGE_EDIT_INTERVAL:
+            if last_update_for_message and now - last_update_for_message < _MIN_MESSAGE_EDIT_INTERVAL_SEC:
                 logger.debug(
                     "Skipping update for %s due to minimum edit interval",
                     message_key,
@@ -301,71 +492,79 @@ async def update_status() -> None:
                 if message_id:
                     try:
                         last_message = await channel.fetch_message(message_id)
-                        logger.info(f'Loaded previous status message for {message_key}')
+                        logger.info('Loaded previous status message for %s', message_key)
                     except discord.NotFound:
-                        logger.warning(f'Stored status message for {message_key} not found, will create a new one')
+                        logger.warning('Stored status message for %s not found, will create a new one', message_key)
                         last_message = None
                     except discord.HTTPException as e:
-                        logger.warning(f'Failed to fetch stored status message for {message_key}: {e}')
+                        logger.warning('Failed to fetch stored status message for %s: %s', message_key, e)
 
             if last_message:
                 try:
-                    await last_message.edit(embed=embed)
-                    logger.debug(f'Status message updated successfully for {message_key}')
+                    async with discord_throttle:
+                        await last_message.edit(embed=embed)
+                    logger.debug('Status message updated successfully for %s', message_key)
                     LAST_EMBED_PAYLOADS[message_key] = embed_payload
                     status_cache[f"last_update_{message_key}"] = now
                 except discord.NotFound:
-                    logger.warning(f'Previous message for {message_key} not found, creating new one')
-                    last_message = await channel.send(embed=embed)
+                    logger.warning('Previous message for %s not found, creating new one', message_key)
+                    async with discord_throttle:
+                        last_message = await channel.send(embed=embed)
                     save_status_message_id(message_path, last_message.id)
                     LAST_EMBED_PAYLOADS[message_key] = embed_payload
                     status_cache[f"last_update_{message_key}"] = now
                 except discord.HTTPException as e:
                     if e.status == 429:  # Rate limited
                         retry_after = e.retry_after if hasattr(e, 'retry_after') else 5
-                        MESSAGE_EDIT_COOLDOWNS[message_key] = now + timedelta(seconds=retry_after)
+                        MESSAGE_EDIT_COOLDOWNS[message_key] = now + retry_after
                         logger.warning(
                             "Rate limited updating %s, backing off for %.2fs",
                             message_key,
                             retry_after,
                         )
                     else:
-                        logger.error(f'HTTP error updating message for {message_key}: {e}')
+                        logger.error('HTTP error updating message for %s: %s', message_key, e)
                         raise
             else:
-                last_message = await channel.send(embed=embed)
-                logger.info(f'Initial status message created for {message_key}')
+                async with discord_throttle:
+                    last_message = await channel.send(embed=embed)
+                logger.info('Initial status message created for %s', message_key)
                 save_status_message_id(message_path, last_message.id)
                 LAST_EMBED_PAYLOADS[message_key] = embed_payload
                 status_cache[f"last_update_{message_key}"] = now
 
             last_messages[message_key] = last_message
         
-        last_update_time = datetime.now()
-        
-        # Check for alerts on all devices
-        from src.device_status import get_all_device_statuses
-        all_statuses = await get_all_device_statuses()
+        # Collect alerts for all devices and the record notification into one message
+        alert_lines = []
         for device_name, status in all_statuses.items():
-            await check_and_send_alerts(channel, device_name, status)
+            try:
+                alert_lines.extend(check_alerts(device_name, status))
+            except Exception as e:
+                logger.error('Alert check failed for %s: %s', device_name, e, exc_info=True)
+        if update_status.current_loop % ALERT_PRUNE_EVERY_TICKS == 0:
+            prune_alert_cooldowns(time.monotonic())
         
-        # Send notification for new records
         if new_record_device and new_record_value:
-            mention = f"<@{get_mention_user_id()}>" if get_mention_user_id() else ""
-            try:
-                await channel.send(
-                    f"{mention} 🎉 Neuer Best-Difficulty Rekord für **{new_record_device}**: {new_record_value}"
-                )
-                logger.info(f'New record notification sent for {new_record_device}')
-            except discord.HTTPException as e:
-                logger.error(f'Failed to send record notification: {e}')
+            alert_lines.append(f"🎉 Neuer Best-Difficulty Rekord für **{new_record_device}**: {new_record_value}")
+        
+        if alert_lines:
+            mention_user_id = get_mention_user_id()
+            mention = f"<@{mention_user_id}>\n" if mention_user_id else ""
+            for content in split_message(mention + "\n".join(alert_lines)):
+                try:
+                    async with discord_throttle:
+                        await channel.send(content)
+                    logger.warning("Alert sent: %s", content)
+                except discord.HTTPException as e:
+                    logger.error("Failed to send alert: %s", e)
     
     except discord.Forbidden:
         logger.error('Bot lacks permissions to send/edit messages in channel')
     except discord.HTTPException as e:
-        logger.error(f'Discord HTTP error in update_status: {e}')
+        logger.error('Discord HTTP error in update_status: %s', e)
     except Exception as e:
-        logger.error(f'Unexpected error in update_status: {e}', exc_info=True)
+        logger.error('Unexpected error in update_status: %s', e, exc_info=True)
 
 
 @update_status.before_loop
@@ -380,6 +579,14 @@ async def before_update_status() -> None:
     logger.info('Bot ready, starting status updates')
 
 
+@update_status.after_loop
+async def after_update_status() -> None:
+    """Write pending best-difficulty records and release the shared device HTTP session when the update loop stops."""
+    await flush_best_diff()
+    await close_session()
+    logger.info('Device HTTP session closed')
+
+
 @update_status.error
 async def update_status_error(error: Exception) -> None:
     """Handle errors in the update status task.
@@ -387,7 +594,7 @@ async def update_status_error(error: Exception) -> None:
     Args:
         error: The exception that occurred
     """
-    logger.error(f'Error in update_status task: {error}', exc_info=True)
+    logger.error('Error in update_status task: %s', error, exc_info=True)
     # Task will automatically restart after error
 
 
@@ -405,15 +612,15 @@ if __name__ == "__main__":
     
     try:
         logger.info('Starting BitAxe Discord Status Bot...')
-        # Run with auto-reconnect enabled (default)
-        bot.run(token, reconnect=True)
+        # Run with auto-reconnect enabled (default); discord.py logs go through our queue handler
+        bot.run(token, reconnect=True, log_handler=None)
     except discord.LoginFailure:
         logger.error('Invalid bot token provided')
         sys.exit(1)
     except KeyboardInterrupt:
         logger.info('Bot stopped by user')
     except Exception as e:
-        logger.error(f'Fatal error: {e}', exc_info=True)
+        logger.error('Fatal error: %s', e, exc_info=True)
         sys.exit(1)
     finally:
         logger.info('Bot shutdown complete')
@@ -1,20 +1,32 @@
 import discord
 from src.device_status import get_all_device_statuses
+from bisect import bisect_left, bisect_right
+import contextlib
+import functools
 import json
 import os
-from datetime import datetime
+import stat
+import tempfile
+from datetime import datetime, timezone
 import logging
 import time
-import threading
-from src.config import get_project_root, get_update_interval, get_mention_user_id, get_devices, get_device_config
+import asyncio
+from typing import Any, Dict, Tuple
+from src.config import get_project_root, get_update_interval, get_mention_user_id, get_devices, get_device_thresholds
 
 # Absolute Pfade für Dateien
 PROJECT_ROOT = get_project_root()
 BEST_DIFF_FILE = os.path.join(PROJECT_ROOT, "data", "best_difficulty.json")
-LOG_FILE = os.path.join(PROJECT_ROOT, "logs", "bitaxe.log")
+BEST_DIFF_HISTORY_FILE = os.path.join(PROJECT_ROOT, "data", "best_difficulty_history.json")
 
-# Lock für Thread-sichere Datei-Operationen
-file_lock = threading.Lock()
+# Maximale Anzahl gespeicherter Rekorde in der Historie
+BEST_DIFF_HISTORY_LIMIT = 10
+
+# Sekunden, die neue Rekorde gesammelt werden, bevor sie gemeinsam auf die Platte geschrieben werden
+BEST_DIFF_FLUSH_DELAY = 2.0
+
+# Obergrenze für den verdoppelten Abstand zwischen Wiederholungen fehlgeschlagener Schreibvorgänge
+BEST_DIFF_RETRY_MAX_DELAY = 60.0
 
 # Lade den Update-Intervall aus der Konfiguration
 update_interval = get_update_interval()
@@ -25,8 +37,9 @@ def get_mention_id():
     return get_mention_user_id()
 
 
+@functools.lru_cache(maxsize=1)
 def get_version() -> str:
-    """Read version from VERSION file.
+    """Read version from VERSION file (once; the result is cached).
     
     Returns:
         Version string (e.g., '2.0.0') or 'unknown' if file not found
@@ -40,24 +53,19 @@ def get_version() -> str:
     except Exception:
         return 'unknown'
 
-# Lade die Best-Difficulty-Historie nur einmal beim Start oder bei einer Änderung
-best_diff_history = []
-
-# Logging konfigurieren mit Rotation
-from logging.handlers import RotatingFileHandler
-logger = logging.getLogger("bitaxe")
-logger.setLevel(logging.INFO)
+# Best-Difficulty-Rekord und -Historie im Speicher, neu geladen nur wenn sich die Datei ändert: (mtime_ns, Daten)
+_best_diff_cache = (None, None)
+_best_diff_history_cache = (None, None)
 
-# File Handler mit Rotation (max 5MB, 3 Backups)
-file_handler = RotatingFileHandler(LOG_FILE, maxBytes=5*1024*1024, backupCount=3)
-file_handler.setFormatter(logging.Formatter("[%(asctime)s] %(levelname)s: %(message)s"))
+# Zuletzt geprüfter bestDiff je Gerät samt damaligem Rekordwert: hostname -> (bestDiff, Rekordwert)
+_last_seen_best_diff: Dict[str, Tuple[Any, Any]] = {}
 
-# Console Handler
-console_handler = logging.StreamHandler()
-console_handler.setFormatter(logging.Formatter("[%(asctime)s] %(levelname)s: %(message)s"))
+# Noch nicht geschriebene Dateiinhalte (Pfad -> Daten) und der Task, der sie verzögert schreibt
+_pending_writes: Dict[str, Any] = {}
+_flush_task = None
 
-logger.addHandler(file_handler)
-logger.addHandler(console_handler)
+# Logging wird zentral in main.py konfiguriert; Records laufen über den Root-Logger
+logger = logging.getLogger("bitaxe")
 
 def format_uptime(seconds):
     """Format uptime in days, hours, minutes."""
@@ -81,44 +89,23 @@ def get_vr_temp(status):
 
 def get_vr_temp_emoji(vr_temp, thresholds, emojis):
     """ Gibt die Ampel für VR-Temperatur zurück, basierend auf den Schwellenwerten """
-    if vr_temp == "n/v":
-        return ""  # Keine Ampel, wenn der Wert "n/v" ist
-    vr_temp = float(vr_temp)
-    if vr_temp < thresholds[0]:
-        return emojis[0]  # Grün
-    elif vr_temp < thresholds[1]:
-        return emojis[1]  # Gelb
-    else:
-        return emojis[2]  # Rot
-
-def get_temp_emoji(value, temp_thresholds, temp_emojis):
-    if value < temp_thresholds[0]:
-        return temp_emojis[0]  # Grün
-    elif value < temp_thresholds[1]:
-        return temp_emojis[1]  # Gelb
-    else:
-        return temp_emojis[2]  # Rot
+    if not vr_temp or vr_temp == "n/v":
+        return ""  # Keine Ampel ohne Messwert (0 wird wie bei get_vr_temp als "n/v" angezeigt)
+    return emojis[bisect_right(thresholds, vr_temp, 0, 2)]  # Grün / Gelb / Rot
 
 def get_fan_emoji(value, fan_thresholds, fan_emojis):
-    if value <= fan_thresholds[0]:
-        return fan_emojis[2]  # Rot
-    elif value <= fan_thresholds[1]:
-        return fan_emojis[1]  # Gelb
-    else:
-        return fan_emojis[0]  # Grün
+    # <= [0] Rot, <= [1] Gelb, sonst Grün
+    return fan_emojis[2 - bisect_left(fan_thresholds, value, 0, 2)]
+
+# RSSI-Grenzen (aufsteigend) und die Ampel je Bereich: < -70 schwach, < -60 mittel, sonst gut
+_RSSI_BREAKS = (-70, -60)
+_RSSI_EMOJIS = ("🔴", "🟡", "🟢")
 
 def get_wifi_emoji(rssi):
     """Get WiFi signal strength emoji based on RSSI."""
     if rssi == 0:
         return "❌"
-    elif rssi >= -50:
-        return "🟢"  # Excellent
-    elif rssi >= -60:
-        return "🟢"  # Good
-    elif rssi >= -70:
-        return "🟡"  # Fair
-    else:
-        return "🔴"  # Weak
+    return _RSSI_EMOJIS[bisect_right(_RSSI_BREAKS, rssi)]
 
 def format_ram(free_heap):
     """Format RAM in KB or MB."""
@@ -127,41 +114,174 @@ def format_ram(free_heap):
     else:
         return f"{free_heap} KB"
 
-def calculate_share_success_rate(accepted, rejected):
-    """Calculate share success rate."""
-    total = accepted + rejected
-    if total == 0:
-        return 100.0
-    return (accepted / total) * 100
-
-def get_volt_emoji(value, thresholds, emojis):
-    if value >= thresholds[2]:
-        return emojis[2]  # rot
-    elif value >= thresholds[1]:
-        return emojis[1]  # gelb
-    else:
-        return emojis[0]  # grün
+# Rechte für neu angelegte JSON-Dateien (lesbar für Host-Prozesse am Docker-Volume)
+NEW_FILE_MODE = 0o644
+
+def _read_json_file(path):
+    """Read and parse a JSON file (blocking, run via asyncio.to_thread)."""
+    with open(path, "r") as f:
+        return json.load(f)
 
-def load_best_diff():
-    global best_diff_history
-    if not best_diff_history:  # Wenn noch keine Daten geladen sind
-        if os.path.exists(BEST_DIFF_FILE):
+def _write_json_file(path, data):
+    """Atomically replace a file with data as JSON and return its new mtime_ns (blocking, run via asyncio.to_thread).
+
+    Written to a temporary file and renamed, so readers always see either the old or the new content without a lock.
+    """
+    # NamedTemporaryFile legt 0600 an; Rechte der bisherigen Datei übernehmen (sonst NEW_FILE_MODE)
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = NEW_FILE_MODE
+    f = tempfile.NamedTemporaryFile("w", dir=os.path.dirname(path), suffix=".tmp", delete=False)
+    try:
+        with f:
+            json.dump(data, f, indent=2)
+            os.fchmod(f.fileno(), mode)
+        mtime_ns = os.stat(f.name).st_mtime_ns  # Bleibt beim Umbenennen erhalten
+        os.replace(f.name, path)
+    except BaseException:
+        # Keine halbfertigen .tmp-Dateien in data/ zurücklassen
+        with contextlib.suppress(OSError):
+            os.unlink(f.name)
+        raise
+    return mtime_ns
+
+def _schedule_write(path, data):
+    """Queue data for path; one delayed flush writes the latest data of all queued files."""
+    global _flush_task
+    _pending_writes[path] = data
+    if _flush_task is None or _flush_task.done():
+        _flush_task = asyncio.get_running_loop().create_task(_flush_after_delay())
+
+async def _flush_after_delay():
+    """Wait BEST_DIFF_FLUSH_DELAY seconds to coalesce writes, then flush; failed writes are retried with backoff."""
+    delay = BEST_DIFF_FLUSH_DELAY
+    while True:
+        await asyncio.sleep(delay)
+        if await flush_best_diff():
+            return
+        delay = min(delay * 2, BEST_DIFF_RETRY_MAX_DELAY)
+
+async def flush_best_diff():
+    """Write all pending best-difficulty files to disk now; returns False if a write failed (it stays pending)."""
+    global _best_diff_cache, _best_diff_history_cache
+    failed = set()
+    # Neu Vorgemerktes, das während eines Schreibvorgangs dazukommt, in der nächsten Runde mitschreiben
+    while True:
+        batch = [(path, data) for path, data in _pending_writes.items() if path not in failed]
+        if not batch:
+            return not failed
+        for path, data in batch:
             try:
-                with file_lock:
-                    with open(BEST_DIFF_FILE, "r") as f:
-                        best_diff_history = json.load(f)
-                        logger.info(f"Best-Difficulty Historie geladen: {best_diff_history}")
-            except (json.JSONDecodeError, IOError) as e:
-                logger.error(f"Fehler beim Laden der Best-Difficulty: {e}")
-                best_diff_history = {}
-        else:
+                mtime_ns = await asyncio.to_thread(_write_json_file, path, data)
+            except OSError as e:
+                # Vorgemerkt lassen: sonst liefern die Loader den alten Rekord und er würde erneut gemeldet
+                logger.error("Fehler beim Speichern von %s: %s", path, e)
+                failed.add(path)
+                continue
+            # Erst nach dem Schreiben entfernen (und nur, wenn inzwischen nichts Neueres vorgemerkt wurde),
+            # damit die Loader bis dahin die neuen Daten sehen
+            if _pending_writes.get(path) is data:
+                del _pending_writes[path]
+            # Cache direkt aktualisieren, damit die gerade geschriebene Datei nicht erneut gelesen wird
+            if path == BEST_DIFF_FILE:
+                _best_diff_cache = (mtime_ns, data)
+            elif path == BEST_DIFF_HISTORY_FILE:
+                _best_diff_history_cache = (mtime_ns, data)
+            logger.debug("Best-Difficulty Datei geschrieben: %s", path)
+
+async def load_best_diff():
+    """Return the stored best-difficulty record ({} if none), re-reading the file only when its mtime changed."""
+    global _best_diff_cache
+    if BEST_DIFF_FILE in _pending_writes:
+        return _pending_writes[BEST_DIFF_FILE]
+    cached_mtime, cached_best = _best_diff_cache
+    try:
+        mtime_ns = os.stat(BEST_DIFF_FILE).st_mtime_ns
+    except OSError:
+        if cached_best is None or cached_mtime is not None:
             logger.info("Best-Difficulty Datei existiert nicht oder ist leer.")
-    return best_diff_history
+        _best_diff_cache = (None, {})
+        return {}
+    if mtime_ns == cached_mtime:
+        return cached_best
 
-def check_and_update_best_diff(status):
-    current_best = load_best_diff()
+    try:
+        best = await asyncio.to_thread(_read_json_file, BEST_DIFF_FILE)
+        logger.info("Best-Difficulty Historie geladen: %s", best)
+    except (json.JSONDecodeError, IOError) as e:
+        logger.error("Fehler beim Laden der Best-Difficulty: %s", e)
+        best = {}
+    _best_diff_cache = (mtime_ns, best)
+    return best
+
+async def load_best_diff_history():
+    """Return the stored record history, newest (= highest) record first, re-reading the file only when its mtime changed."""
+    global _best_diff_history_cache
+    if BEST_DIFF_HISTORY_FILE in _pending_writes:
+        return _pending_writes[BEST_DIFF_HISTORY_FILE]
+    cached_mtime, cached_history = _best_diff_history_cache
+    try:
+        mtime_ns = os.stat(BEST_DIFF_HISTORY_FILE).st_mtime_ns
+    except OSError:
+        _best_diff_history_cache = (None, [])
+        return []
+    if mtime_ns == cached_mtime:
+        return cached_history
+
+    try:
+        history = await asyncio.to_thread(_read_json_file, BEST_DIFF_HISTORY_FILE)
+        if not isinstance(history, list):
+            raise ValueError("Historie ist keine Liste")
+    except (json.JSONDecodeError, IOError, ValueError) as e:
+        logger.error("Fehler beim Laden der Best-Difficulty Historie: %s", e)
+        history = []
+    _best_diff_history_cache = (mtime_ns, history)
+    return history
+
+async def add_best_diff_history(best_diff, hostname, timestamp):
+    """Prepend a new record to the history, keeping at most BEST_DIFF_HISTORY_LIMIT entries; written by the next flush."""
+    entry = {
+        "timestamp": timestamp,
+        "value": best_diff,
+        "short": get_best_diff_suffix(best_diff),
+        "hostname": hostname
+    }
+    history = [entry] + (await load_best_diff_history())[:BEST_DIFF_HISTORY_LIMIT - 1]
+    _schedule_write(BEST_DIFF_HISTORY_FILE, history)
+
+def parse_timestamp(value):
+    """Parse a stored timestamp (ISO string or epoch seconds) into an aware UTC datetime; naive values are UTC."""
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value, tz=timezone.utc)
+    timestamp = datetime.fromisoformat(value)
+    if timestamp.tzinfo is None:
+        return timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.astimezone(timezone.utc)
+
+# Zehnerexponent je Difficulty-Suffix; einzige Quelle für Parser und Suffix-Erkennung
+DIFF_SUFFIX_EXPONENTS = {"K": 3, "M": 6, "G": 9, "T": 12}
+
+def parse_best_diff(best_diff):
+    """Convert a bestDiff value like '1.2M' or '4.35G' to an int."""
+    best_diff_str = str(best_diff).strip()
+    if best_diff_str.isdigit():
+        return int(best_diff_str)
+    exponent = DIFF_SUFFIX_EXPONENTS.get(best_diff_str[-1:].upper())
+    if exponent:
+        best_diff_str = f"{best_diff_str[:-1]}e{exponent}"
+    return int(float(best_diff_str))
+
+async def check_and_update_best_diff(status):
+    current_best = await load_best_diff()
     new_record = False
     new_record_value = None
+
+    # Unveränderter bestDiff gegen denselben Rekord wie beim letzten Mal: nichts zu prüfen
+    hostname = status.get('hostname')
+    seen_key = (status.get('bestDiff'), current_best.get('value'))
+    if _last_seen_best_diff.get(hostname) == seen_key:
+        return new_record, new_record_value
     
     try:
         # Neue Best-Difficulty prüfen
@@ -169,75 +289,59 @@ def check_and_update_best_diff(status):
         if not best_diff_str or best_diff_str == '-':
             return new_record, new_record_value
             
-        val_str = best_diff_str.lower().replace("g", "e9").replace("m", "e6").replace("k", "e3")
-        numeric_val = int(float(val_str))
+        numeric_val = parse_best_diff(best_diff_str)
         
         if not current_best or numeric_val > int(current_best.get('value', 0)):
-            save_best_diff(numeric_val, status['bestDiff'], status['hostname'])
+            await save_best_diff(numeric_val, status['bestDiff'], status['hostname'])
             new_record = True
-            new_record_value = format_best_diff(status['bestDiff'])
+            new_record_value = format_diff_value(numeric_val, get_best_diff_suffix(best_diff_str))
+            seen_key = (status['bestDiff'], numeric_val)
     except (ValueError, TypeError) as e:
-        logger.warning(f"Fehler beim Parsen von bestDiff '{status.get('bestDiff')}': {e}")
+        logger.warning("Fehler beim Parsen von bestDiff '%s': %s", status.get('bestDiff'), e)
+    finally:
+        _last_seen_best_diff[hostname] = seen_key
 
     return new_record, new_record_value
 
-def save_best_diff(value, best_diff, hostname):
-    # Extrahiere das Suffix (G/M/K) sicher
-    suffix = 'G'  # Default
-    best_diff_str = str(best_diff).upper()
-    if best_diff_str and len(best_diff_str) > 0:
-        last_char = best_diff_str[-1]
-        if last_char in ['G', 'M', 'K']:
-            suffix = last_char
-    
+async def save_best_diff(value, best_diff, hostname):
     best = {
         "value": value,
-        "short": suffix,
+        "short": get_best_diff_suffix(best_diff),
         "hostname": hostname,
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": datetime.now(timezone.utc).isoformat()
     }
 
-    try:
-        with file_lock:
-            with open(BEST_DIFF_FILE, "w") as f:
-                json.dump(best, f, indent=2)
-        logger.info(f"🏆 Neuer Best-Difficulty gespeichert: {best_diff} von {hostname}")
-    except IOError as e:
-        logger.error(f"Fehler beim Speichern der Best-Difficulty: {e}")
+    # Geschrieben wird gesammelt durch flush_best_diff(); bis dahin liefert load_best_diff() den neuen Rekord
+    _schedule_write(BEST_DIFF_FILE, best)
+    logger.info("🏆 Neuer Best-Difficulty gespeichert: %s von %s", best_diff, hostname)
+
+    await add_best_diff_history(best_diff, hostname, best["timestamp"])
 
 def get_best_diff_suffix(best_diff):
-    best_diff_str = str(best_diff).strip().upper()
-    if best_diff_str and best_diff_str[-1] in ["G", "M", "K"]:
-        return best_diff_str[-1]
-    return ""
+    suffix = str(best_diff).strip()[-1:].upper()
+    return suffix if suffix in DIFF_SUFFIX_EXPONENTS else ""
 
 def format_best_diff(best_diff):
     try:
-        best_diff_str = str(best_diff).strip().upper()
         # Umwandlung der Best-Difficulty in ein numerisches Format
-        if 'G' in best_diff_str:  # Falls es sich um Gigabytes handelt
-            value = float(best_diff_str.replace('G', '').strip()) * 1e9
-            formatted_value = f"{int(value):,} (G)"
-        elif 'M' in best_diff_str:  # Falls es sich um Megabytes handelt
-            value = float(best_diff_str.replace('M', '').strip()) * 1e6
-            formatted_value = f"{int(value):,} (M)"
-        elif 'K' in best_diff_str:  # Falls es sich um Kilobytes handelt
-            value = float(best_diff_str.replace('K', '').strip()) * 1e3
-            formatted_value = f"{int(value):,} (K)"
-        else:
-            value = float(best_diff_str)
-            formatted_value = f"{int(value):,}"
-        return formatted_value
-    except Exception as e:
-        logger.error(f"Fehler bei der Formatierung der Best-Difficulty: {e}")
+        value = parse_best_diff(best_diff)
+    except (ValueError, TypeError) as e:
+        logger.error("Fehler bei der Formatierung der Best-Difficulty: %s", e)
         return str(best_diff)  # Falls etwas schief geht, einfach den Originalwert zurückgeben
+    return format_diff_value(value, get_best_diff_suffix(best_diff))
+
+def format_diff_value(value, suffix):
+    """Format an already parsed difficulty with thousands separators and its suffix, e.g. '1,200,000 (M)'."""
+    return f"{value:,} ({suffix})" if suffix else f"{value:,}"
 
 def chunk_embed_field(value, max_length=1024):
+    if len(value) <= max_length:
+        return [value]  # Häufigster Fall: passt in ein Feld
     if value.startswith("```") and value.endswith("```"):
         code_fence = value.split("\n", 1)[0]
         inner = value[len(code_fence) + 1:-3]
-        chunks = [inner[i:i + max_length - len(code_fence) - 4] for i in range(0, len(inner), max_length - len(code_fence) - 4)]
-        return [f"{code_fence}\n{chunk}```" for chunk in chunks]
+        step = max_length - len(code_fence) - 4  # Platz für Fence, Zeilenumbruch und schließende ```
+        return [f"{code_fence}\n{inner[i:i + step]}```" for i in range(0, len(inner), step)]
     return [value[i:i + max_length] for i in range(0, len(value), max_length)]
 
 def add_spacer_field(embed):
@@ -245,90 +349,82 @@ def add_spacer_field(embed):
 
 def build_summary(data):
     total_devices = len(data)
-    online_devices = sum(1 for s in data.values() if "error" not in s)
+    online_devices = 0
+    total_hashrate = 0
+    total_power = 0
+    # Ein Durchlauf für Online-Zähler, Hashrate und Leistung
+    for s in data.values():
+        if "error" in s:
+            continue
+        online_devices += 1
+        total_hashrate += s.get('hashRate', 0)
+        total_power += s.get('power', 0)
     offline_devices = total_devices - online_devices
-    total_hashrate = sum(s.get('hashRate', 0) for s in data.values() if "error" not in s)
-    total_power = sum(s.get('power', 0) for s in data.values() if "error" not in s)
     total_efficiency = total_hashrate / total_power if total_power > 0 else 0
     return total_devices, online_devices, offline_devices, total_hashrate, total_power, total_efficiency
 
-async def format_status_embeds():
-    data = await get_all_device_statuses()
-    current_best = load_best_diff()  # Lade die Best-Difficulty-Historie nur einmal
-    new_record = False
-    new_record_value = None
-    best_diff_history = []  # History der Best-Difficulty
-
-    # Formatierte Zeitangabe für "Vor"
-    def format_time_ago(minutes):
-        days, remainder = divmod(minutes, 1440)  # 1440 Minuten = 1 Tag
-        hours, minutes = divmod(remainder, 60)  # 60 Minuten = 1 Stunde
-        time_ago = ""
-        if days > 0:
-            time_ago += f"{days} Tage "
-        if hours > 0:
-            time_ago += f"{hours} Stunden "
-        if minutes > 0:
-            time_ago += f"{minutes} Minuten"
-        return time_ago.strip()
-
-    # Berechnung der Zeitdifferenz in Minuten
-    for hostname, status in data.items():
-        if "error" in status:
-            continue
-
-        try:
-            # Überprüfe und speichere Best-Difficulty nur bei Änderung
-            is_new_record, record_value = check_and_update_best_diff(status)
-            if is_new_record:
-                new_record = True
-                new_record_value = record_value
-            
-            val_str = str(status['bestDiff']).lower().replace("g", "e9").replace("m", "e6").replace("k", "e3")
-            numeric_val = int(float(val_str))
-
-            # Füge den aktuellen Best-Difficulty zur Historie hinzu
-            best_diff_history.append({
-                "timestamp": datetime.utcnow().isoformat(),
-                "value": status['bestDiff'],
-                "short": get_best_diff_suffix(status['bestDiff']),
-                "hostname": hostname
-            })
-
-        except Exception as e:
-            logger.warning(f"Fehler beim Parsen von BestDiff für {hostname}: {e}")
-            continue
-
+# Ampel-Emojis (grün, gelb, rot) für die Schwellenwert-Anzeigen
+TRAFFIC_LIGHT_EMOJIS = ("🟢", "🟡", "🔴")
+
+# Feste Textbausteine der Geräte-Felder, einmal definiert und per str.format_map befüllt
+DEVICE_HARDWARE_TEMPLATE = (
+    "```ansi\n"
+    "##########################\n"
+    "# Hardware-Informationen #\n"
+    "##########################\n"
+    "\n"
+    "🖥️ ASICModel : {ASICModel}\n"
+    "🧭 Frequency : {frequency} MHz @{core_voltage_actual_v:.3f}V | {core_voltage_v:.3f}V\n"
+    "🔧 Device    : {deviceModel}\n"
+    "⏰ Uptime    : {uptime}\n"
+    "🧠 Free RAM  : {ram}\n"
+    "📦 Version   : {version}\n"
+    "🌐 WiFi      : {ssid} ({wifiRSSI} dBm) {wifi_emoji}\n"
+    "📍 IP/MAC    : {ip} | {mac}\n"
+)
+DEVICE_POWER_TEMPLATE = (
+    "🔌 VR Temp   : {vr_temp} {vr_temp_emoji}\n"
+    "🔋 Power     : {power:.2f} W @ {voltage_v:.3f} V\n"
+)
+DEVICE_STRATUM_TEMPLATE = (
+    "📈 Eff       : {efficiency:.2f} GH/W\n"
+    "💨 Fan       : {fanspeed}% / {fanrpm} RPM {fan_emoji}\n"
+    "#########################\n"
+    "# Stratum-Informationen #\n"
+    "#########################\n"
+    "🌐 Stratum   : {stratumURL}:{stratumPort} {stratum_mark}\n"
+    "⚠️ Fallback  : {fallbackStratumURL}:{fallbackStratumPort} {fallback_mark}\n"
+    "👤 User      : {stratumUser}\n"
+)
+
+def build_device_embeds(data):
+    """Build the BitAxe and NerdAxe overview embeds from the device statuses."""
     bitaxe_embed = discord.Embed(title="📡 BitAxe Geräteübersicht", color=discord.Color.green())
     nerdaxe_embed = discord.Embed(title="📡 NerdAxe Geräteübersicht", color=discord.Color.blue())
-    history_embed = discord.Embed(title="🏆 Best-Difficulty Historie", color=discord.Color.gold())
     add_spacer_field(bitaxe_embed)
     add_spacer_field(nerdaxe_embed)
-    add_spacer_field(history_embed)
 
     bitaxe_data = {}
     nerdaxe_data = {}
 
-    sorted_data = sorted(data.items(), key=lambda x: x[0])
+    sorted_data = sorted(data.items())  # Schlüssel sind eindeutig, Werte werden nie verglichen
     devices = get_devices()
 
-    device_entries = []
+    # Ein Durchlauf: Geräte direkt der BitAxe- oder NerdAxe-Liste zuordnen
+    bitaxe_entries = []
+    nerdaxe_entries = []
     for hostname, status in sorted_data:
-        if "error" in status:
+        is_error = "error" in status
+        if is_error:
             is_nerdaxe = "nerd" in hostname.lower()
-            device_entries.append((hostname, status, is_nerdaxe, True))
-            if is_nerdaxe:
-                nerdaxe_data[hostname] = status
-            else:
-                bitaxe_data[hostname] = status
-            continue
-
-        is_nerdaxe = status.get('vrFrequency', 0) > 0 or status.get('jobInterval', 0) > 0
-        device_entries.append((hostname, status, is_nerdaxe, False))
+        else:
+            is_nerdaxe = status.get('vrFrequency', 0) > 0 or status.get('jobInterval', 0) > 0
         if is_nerdaxe:
             nerdaxe_data[hostname] = status
+            nerdaxe_entries.append((hostname, status, is_error))
         else:
             bitaxe_data[hostname] = status
+            bitaxe_entries.append((hostname, status, is_error))
     bitaxe_stats = build_summary(bitaxe_data)
     nerdaxe_stats = build_summary(nerdaxe_data)
 
@@ -344,243 +440,245 @@ async def format_status_embeds():
         )
         embed.add_field(name="📊 Übersicht", value=summary, inline=False)
 
-    for hostname, status, is_nerdaxe, is_error in device_entries:
-        target_embed = nerdaxe_embed if is_nerdaxe else bitaxe_embed
-        if is_error:
-            target_embed.add_field(
-                name=f"❌ {hostname}",
-                value=f"Fehler beim Abrufen: `{status['error']}`",
-                inline=False
-            )
-            continue
+    for target_embed, entries, is_nerdaxe in ((bitaxe_embed, bitaxe_entries, False), (nerdaxe_embed, nerdaxe_entries, True)):
+        for hostname, status, is_error in entries:
+            if is_error:
+                target_embed.add_field(
+                    name=f"❌ {hostname}",
+                    value=f"Fehler beim Abrufen: `{status['error']}`",
+                    inline=False
+                )
+                continue
 
-        device_config = devices.get(hostname, {})
-        ip = device_config.get('ip', status['ip'])
+            device_config = devices.get(hostname, {})
+            ip = device_config.get('ip', status['ip'])
 
-        # Spannung bleibt in mV
-        voltage = status.get('voltage', 1000)  # Spannung bleibt in mV
+            # Spannung bleibt in mV
+            voltage = status.get('voltage', 1000)  # Spannung bleibt in mV
 
-        # Schwellenwerte aus Konfiguration (mit Validierung)
-        try:
-            vr_temp_thresholds = list(map(int, device_config.get('vr_temp_thresholds', '50,60,70').split(',')))
-            temp_thresholds = list(map(int, device_config.get('temp_thresholds', '50,60,70').split(',')))
-            fan_thresholds = list(map(int, device_config.get('fan_thresholds', '0,2000,3500,7500').split(',')))
-            volt_thresholds = list(map(float, device_config.get('volt_thresholds', '1.0,1.2,1.4').split(',')))
-        except (ValueError, AttributeError) as e:
-            logger.warning(f"Fehler beim Parsen der Schwellenwerte für {hostname}: {e}. Verwende Defaults.")
-            vr_temp_thresholds = [50, 60, 70]
-            temp_thresholds = [50, 60, 70]
-            fan_thresholds = [0, 2000, 3500, 7500]
-            volt_thresholds = [1.0, 1.2, 1.4]
-
-        # VR-Temperatur-Ampel
-        vr_temp_emoji = get_vr_temp_emoji(status['vrTemp'], vr_temp_thresholds, ["🟢", "🟡", "🔴"])
-        temp_emoji = get_temp_emoji(status['temp'], temp_thresholds, ["🟢", "🟡", "🔴"])
-        fan_emoji = get_fan_emoji(status['fanrpm'], fan_thresholds, ["🟢", "🟡", "🔴"])
-        volt_emoji = get_volt_emoji(voltage, volt_thresholds, ["🟢", "🟡", "🔴"])
-        
-        # WiFi-Info
-        wifi_rssi = status.get('wifiRSSI', 0)
-        wifi_ssid = status.get('ssid', '-')
-        wifi_emoji = get_wifi_emoji(wifi_rssi)
+            # Schwellenwerte aus Konfiguration (einmal pro Gerät geparst und gecacht)
+            thresholds = get_device_thresholds(hostname)
+            vr_temp_thresholds = thresholds['vr_temp_thresholds']
+            fan_thresholds = thresholds['fan_thresholds']
+
+            # Ampeln (nur die im Embed angezeigten)
+            vr_temp_emoji = get_vr_temp_emoji(status['vrTemp'], vr_temp_thresholds, TRAFFIC_LIGHT_EMOJIS)
+            fan_emoji = get_fan_emoji(status['fanrpm'], fan_thresholds, TRAFFIC_LIGHT_EMOJIS)
         
-        # System-Info
-        uptime_str = format_uptime(status.get('uptimeSeconds', 0))
-        free_heap = status.get('freeHeap', 0)
-        ram_str = format_ram(free_heap)
-        version_str = status.get('version', 'N/A')
+            # WiFi-Info
+            wifi_rssi = status.get('wifiRSSI', 0)
+            wifi_ssid = status.get('ssid', '-')
+            wifi_emoji = get_wifi_emoji(wifi_rssi)
         
-        # Share-Erfolgsrate
-        accepted = status.get('sharesAccepted', 0)
-        rejected = status.get('sharesRejected', 0)
-        success_rate = calculate_share_success_rate(accepted, rejected)
+            # System-Info
+            uptime_str = format_uptime(status.get('uptimeSeconds', 0))
+            free_heap = status.get('freeHeap', 0)
+            ram_str = format_ram(free_heap)
+            version_str = status.get('version', 'N/A')
         
-        # Expected Hashrate (falls vorhanden)
-        expected_hr = status.get('expectedHashrate', 0)
+            # Power Limits
+            min_power = status.get('minPower', 0)
+            max_power = status.get('maxPower', 0)
+            power_limit = status.get('powerLimit', 0)
         
-        # Power Limits
-        min_power = status.get('minPower', 0)
-        max_power = status.get('maxPower', 0)
-        power_limit = status.get('powerLimit', 0)
+            # Voltage Limits
+            min_voltage = status.get('minVoltage', 0)
+            max_voltage = status.get('maxVoltage', 0)
         
-        # Voltage Limits
-        min_voltage = status.get('minVoltage', 0)
-        max_voltage = status.get('maxVoltage', 0)
+            # Overheat Protection
+            overheat_mode = status.get('overheat_mode', False)
+            overheat_temp = status.get('overheat_temp', 0)
+            temp_target = status.get('temptarget', 0)
         
-        # Overheat Protection
-        overheat_mode = status.get('overheat_mode', False)
-        overheat_temp = status.get('overheat_temp', 0)
-        temp_target = status.get('temptarget', 0)
+            ctx = {
+                'ASICModel': status['ASICModel'],
+                'frequency': status['frequency'],
+                'core_voltage_actual_v': status['coreVoltageActual'] / 1000,
+                'core_voltage_v': status['coreVoltage'] / 1000,
+                'deviceModel': status.get('deviceModel', 'Unknown'),
+                'uptime': uptime_str,
+                'ram': ram_str,
+                'version': version_str,
+                'ssid': wifi_ssid,
+                'wifiRSSI': wifi_rssi,
+                'wifi_emoji': wifi_emoji,
+                'ip': ip,
+                'mac': status.get('mac', 'N/A'),
+                'vr_temp': get_vr_temp(status),
+                'vr_temp_emoji': vr_temp_emoji,
+                'power': status['power'],
+                'voltage_v': voltage / 1000,
+                'efficiency': status['hashRate'] / status['power'] if status['power'] > 0 else 0,
+                'fanspeed': status.get('fanspeed', 0),
+                'fanrpm': status['fanrpm'],
+                'fan_emoji': fan_emoji,
+                'stratumURL': status['stratumURL'],
+                'stratumPort': status['stratumPort'],
+                'fallbackStratumURL': status['fallbackStratumURL'],
+                'fallbackStratumPort': status['fallbackStratumPort'],
+                'stratum_mark': '✅' if not status.get('isUsingFallbackStratum', False) else '❌',
+                'fallback_mark': '✅' if status.get('isUsingFallbackStratum', False) else '❌',
+                'stratumUser': status['stratumUser'],
+            }
+            parts = [DEVICE_HARDWARE_TEMPLATE.format_map(ctx)]
         
-        # Hashrate-Metriken (erweitert für NerdAxe)
-        hashrate_section = f"⚡ Hashrate  : 🔥 **{status['hashRate']:.2f} GH/s** 🔥\n"
+            # Overheat Protection Status
+            if temp_target > 0:
+                parts.append(f" (Target: {temp_target}°C)\n")
+            else:
+                parts.append("\n")
         
-        # Expected vs Actual Hashrate
-        if expected_hr > 0:
-            actual_percent = (status['hashRate'] / expected_hr) * 100
-            hashrate_section += f"🎯 Expected : {expected_hr:.1f} GH/s ({actual_percent:.1f}%)\n"
+            if overheat_temp > 0:
+                overheat_status = "🟢 Aus" if not overheat_mode else "🔴 Aktiv"
+                parts.append(f"🛡️ Overheat  : {overheat_status} (Grenze: {overheat_temp}°C)\n")
         
-        if is_nerdaxe:
-            # NerdAxe: Zeige erweiterte Hashrate-Metriken
-            hr_1m = status.get('hashRate_1m', 0)
-            hr_10m = status.get('hashRate_10m', 0)
-            hr_1h = status.get('hashRate_1h', 0)
-            hr_1d = status.get('hashRate_1d', 0)
-            if hr_1m > 0 or hr_10m > 0 or hr_1h > 0:
-                hashrate_section += f"📊 Avg 1m/10m/1h: {hr_1m:.1f} / {hr_10m:.1f} / {hr_1h:.1f} GH/s\n"
-                if hr_1d > 0:
-                    hashrate_section += f"📊 Avg 24h    : {hr_1d:.1f} GH/s\n"
+            parts.append(DEVICE_POWER_TEMPLATE.format_map(ctx))
         
-        # NerdAxe-spezifische Statistiken
-        nerdaxe_stats = ""
-        if is_nerdaxe:
-            found_blocks = status.get('foundBlocks', 0)
-            total_blocks = status.get('totalFoundBlocks', 0)
-            dup_nonces = status.get('duplicateHWNonces', 0)
-            if found_blocks > 0 or total_blocks > 0:
-                nerdaxe_stats = (
-                    f"#########################\n"
-                    f"# NerdAxe Statistiken   #\n"
-                    f"#########################\n"
-                    f"🏆 Blocks (Session): {found_blocks}\n"
-                    f"🏆 Blocks (Total)  : {total_blocks}\n"
-                )
-                if dup_nonces > 0:
-                    nerdaxe_stats += f"⚠️ Duplicate Nonces: {dup_nonces}\n"
-            
-            # PID Controller (NerdAxe)
-            pid_p = status.get('pidP', 0)
-            pid_i = status.get('pidI', 0)
-            pid_d = status.get('pidD', 0)
-            if pid_p > 0 or pid_i > 0 or pid_d > 0:
-                nerdaxe_stats += (
-                    f"🎛️ PID (P/I/D)   : {pid_p:.2f} / {pid_i:.2f} / {pid_d:.2f}\n"
-                )
+            # Power Limits (falls verfügbar)
+            if min_power > 0 or max_power > 0:
+                limit = f" (Limit: {power_limit:.1f}W)" if power_limit > 0 else ""
+                parts.append(f"⚡ Limits    : {min_power:.1f}W - {max_power:.1f}W{limit}\n")
         
-        value = (
-            f"```ansi\n"
-            f"##########################\n"
-            f"# Hardware-Informationen #\n"
-            f"##########################\n"
-            f"\n"  # Added blank line here
-
-            f"🖥️ ASICModel : {status['ASICModel']}\n"
-            f"🧭 Frequency : {status['frequency']} MHz @{status['coreVoltageActual']/1000:.3f}V | {status['coreVoltage']/1000:.3f}V\n"
-            f"🔧 Device    : {status.get('deviceModel', 'Unknown')}\n"
-            f"⏰ Uptime    : {uptime_str}\n"
-            f"🧠 Free RAM  : {ram_str}\n"
-            f"📦 Version   : {version_str}\n"
-            f"🌐 WiFi      : {wifi_ssid} ({wifi_rssi} dBm) {wifi_emoji}\n"
-            f"📍 IP/MAC    : {ip} | {status.get('mac', 'N/A')}\n"
-        )
+            # Voltage Limits (falls verfügbar)
+            if min_voltage > 0 or max_voltage > 0:
+                parts.append(f"📊 Volt Range: {min_voltage/1000:.3f}V - {max_voltage/1000:.3f}V\n")
         
-        # Overheat Protection Status
-        if temp_target > 0:
-            value += f" (Target: {temp_target}°C)\n"
-        else:
-            value += "\n"
+            parts.append(DEVICE_STRATUM_TEMPLATE.format_map(ctx))
         
-        if overheat_temp > 0:
-            overheat_status = "🟢 Aus" if not overheat_mode else "🔴 Aktiv"
-            value += f"🛡️ Overheat  : {overheat_status} (Grenze: {overheat_temp}°C)\n"
+            # NerdAxe: Pool-Details anzeigen
+            if is_nerdaxe:
+                pool_mode = status.get('stratum_poolMode', '-')
+                pool_balance = status.get('stratum_poolBalance', 0)
+                if pool_mode != '-':
+                    parts.append(f"🎱 Pool Mode : {pool_mode}\n")
+                    if pool_balance > 0:
+                        parts.append(f"⚖️ Balance   : {pool_balance}\n")
         
-        value += (
-            f"🔌 VR Temp   : {get_vr_temp(status)} {vr_temp_emoji}\n"
-            f"🔋 Power     : {status['power']:.2f} W @ {voltage/1000:.3f} V\n"
+            parts.append("```")
+            value = "".join(parts)
+
+            value_chunks = chunk_embed_field(value)
+            for index, chunk in enumerate(value_chunks):
+                field_name = f"🛠️ {hostname}"
+                if index > 0:
+                    field_name = f"🛠️ {hostname} (Fortsetzung {index + 1})"
+                target_embed.add_field(name=field_name, value=chunk, inline=False)
+
+    return bitaxe_embed, nerdaxe_embed
+
+def format_time_ago(minutes):
+    """Format a number of minutes as 'X Tage Y Stunden Z Minuten' (zero parts omitted)."""
+    days, remainder = divmod(minutes, 1440)  # 1440 Minuten = 1 Tag
+    hours, minutes = divmod(remainder, 60)  # 60 Minuten = 1 Stunde
+    time_ago = ""
+    if days > 0:
+        time_ago += f"{days} Tage "
+    if hours > 0:
+        time_ago += f"{hours} Stunden "
+    if minutes > 0:
+        time_ago += f"{minutes} Minuten"
+    return time_ago.strip()
+
+# Zuletzt gerenderter Rekord: (Rekord, Zeitpunkt in Sekunden, feste Zeilen); nur "Vor" ändert sich pro Tick
+_record_block_cache = (None, None, None)
+
+def format_record_block(record):
+    """Render the current record as a code block; only the 'Vor' line is rebuilt while the record is unchanged."""
+    global _record_block_cache
+    cached_record, recorded_at, head = _record_block_cache
+    if record is not cached_record:
+        timestamp = parse_timestamp(record['timestamp'])
+        recorded_at = timestamp.timestamp()
+        head = (
+            f"```ansi\n"
+            f"💎 Wert      : {format_diff_value(int(record['value']), record['short'])}.\n"
+            f"🛠️ Gerät     : {record['hostname']}\n"
+            f"🕒 Zeit      : {timestamp.strftime('%d.%m.%Y %H:%M')}\n"
         )
-        
-        # Power Limits (falls verfügbar)
-        if min_power > 0 or max_power > 0:
-            value += f"⚡ Limits    : {min_power:.1f}W - {max_power:.1f}W"
-            if power_limit > 0:
-                value += f" (Limit: {power_limit:.1f}W)"
-            value += "\n"
-        
-        # Voltage Limits (falls verfügbar)
-        if min_voltage > 0 or max_voltage > 0:
-            value += f"📊 Volt Range: {min_voltage/1000:.3f}V - {max_voltage/1000:.3f}V\n"
-        
-        value += (
-            f"📈 Eff       : {status['hashRate'] / status['power'] if status['power'] > 0 else 0:.2f} GH/W\n"
-            f"💨 Fan       : {status.get('fanspeed', 0)}% / {status['fanrpm']} RPM {fan_emoji}\n"
-
-            f"#########################\n"
-            f"# Stratum-Informationen #\n"
-            f"#########################\n"
-            f"🌐 Stratum   : {status['stratumURL']}:{status['stratumPort']} {'✅' if not status.get('isUsingFallbackStratum', False) else '❌'}\n"
-            f"⚠️ Fallback  : {status['fallbackStratumURL']}:{status['fallbackStratumPort']} {'✅' if status.get('isUsingFallbackStratum', False) else '❌'}\n"
-            f"👤 User      : {status['stratumUser']}\n"
+        _record_block_cache = (record, recorded_at, head)
+    minutes_ago = int((time.time() - recorded_at) // 60)
+    return f"{head}⏱️ Vor       : {format_time_ago(minutes_ago)}\n```"
+
+HISTORY_HEADER = "```ansi\nRank | 📅 Date              | 💎 BestDiff             | 🖥️ Device\n" + "-"*65 + "\n"
+HISTORY_FOOTER = "```"
+
+# Zuletzt gerenderte Historie: (Historien-Liste, Text); die Liste bleibt dasselbe Objekt, solange sie sich nicht ändert
+_history_block_cache = (None, None)
+
+def format_history_block(history, max_length=1024):
+    """Render the record history as a code block that fits into one embed field."""
+    global _history_block_cache
+    cached_history, cached_block = _history_block_cache
+    if history is cached_history:
+        return cached_block
+
+    parts = [HISTORY_HEADER]
+    length = len(HISTORY_HEADER) + len(HISTORY_FOOTER)
+    for i, entry in enumerate(history, 1):
+        rank = '🥇' if i == 1 else '🥈' if i == 2 else '🥉' if i == 3 else str(i)
+        best_diff_short = entry['short'] or get_best_diff_suffix(entry['value'])
+        line = (
+            f"{rank}   | {parse_timestamp(entry['timestamp']).strftime('%d.%m.%Y %H:%M').ljust(20)} | "
+            f"{entry['value']} ({best_diff_short})          | {entry['hostname']}\n"
         )
-        
-        # NerdAxe: Pool-Details anzeigen
-        if is_nerdaxe:
-            pool_mode = status.get('stratum_poolMode', '-')
-            pool_balance = status.get('stratum_poolBalance', 0)
-            if pool_mode != '-':
-                value += f"🎱 Pool Mode : {pool_mode}\n"
-                if pool_balance > 0:
-                    value += f"⚖️ Balance   : {pool_balance}\n"
-        
-        value += "```"
+        length += len(line)
+        if length > max_length:
+            break
+        parts.append(line)
+    parts.append(HISTORY_FOOTER)
+    block = "".join(parts)
+    _history_block_cache = (history, block)
+    return block
+
+async def format_status_embeds(data=None):
+    """Build the status embeds, fetching statuses unless data is passed in; returns (embeds, new-record device or None, record value)."""
+    if data is None:
+        data = await get_all_device_statuses()
+    new_record_device = None  # Gerät mit neuem Rekord in diesem Durchlauf
+    new_record_value = None
+    # Neue Rekorde prüfen; bei einem Rekord werden Rekord-Datei und Historie geschrieben
+    for hostname, status in data.items():
+        if "error" in status:
+            continue
+
+        try:
+            # Überprüfe und speichere Best-Difficulty nur bei Änderung
+            is_new_record, record_value = await check_and_update_best_diff(status)
+            if is_new_record:
+                new_record_device = hostname
+                new_record_value = record_value
+        except Exception as e:
+            logger.warning("Fehler beim Parsen von BestDiff für %s: %s", hostname, e)
+            continue
+
+    # Erst nach der Prüfung laden, damit ein neuer Rekord sofort angezeigt wird (aus dem Cache, solange die Datei unverändert ist)
+    current_best = await load_best_diff()
+    best_diff_history = await load_best_diff_history()
+
+    history_embed = discord.Embed(title="🏆 Best-Difficulty Historie", color=discord.Color.gold())
+    add_spacer_field(history_embed)
 
-        value_chunks = chunk_embed_field(value)
-        target_embed = nerdaxe_embed if is_nerdaxe else bitaxe_embed
-        for index, chunk in enumerate(value_chunks):
-            field_name = f"🛠️ {hostname}"
-            if index > 0:
-                field_name = f"🛠️ {hostname} (Fortsetzung {index + 1})"
-            target_embed.add_field(name=field_name, value=chunk, inline=False)
+    bitaxe_embed, nerdaxe_embed = build_device_embeds(data)
 
     if current_best:
         add_spacer_field(history_embed)
-        timestamp = datetime.fromisoformat(current_best['timestamp'])
-        minutes_ago = int((datetime.utcnow() - timestamp).total_seconds() // 60)
-        formatted_time_ago = format_time_ago(minutes_ago)  # Zeit in Tagen, Stunden, Minuten formatieren
-        record_block = (
-            f"```ansi\n"
-            f"💎 Wert      : {int(current_best['value']):,} ({current_best['short']}).\n"
-            f"🛠️ Gerät     : {current_best['hostname']}\n"
-            f"🕒 Zeit      : {timestamp.strftime('%d.%m.%Y %H:%M')}\n"
-            f"⏱️ Vor       : {formatted_time_ago}\n"
-            f"```"
-        )
         title = "🏆 Rekord-Difficulty"
-        if new_record and MENTION_ID:
-            title += f" – <@{MENTION_ID}> Neuer Rekord!"
-        history_embed.add_field(name=title, value=record_block, inline=False)
+        if new_record_device:
+            mention_id = get_mention_id()  # Aus dem Konfigurations-Cache
+            if mention_id:
+                title += f" – <@{mention_id}> Neuer Rekord!"
+        history_embed.add_field(name=title, value=format_record_block(current_best), inline=False)
 
     # Best-Difficulty Historie unter den Geräten
     if best_diff_history:
-        history_header = "```ansi\nRank | 📅 Date              | 💎 BestDiff             | 🖥️ Device\n" + "-"*65 + "\n"
-        history_footer = "```"
-        history_lines = []
-        for i, entry in enumerate(best_diff_history, 1):
-            rank = '🥇' if i == 1 else '🥈' if i == 2 else '🥉' if i == 3 else str(i)
-            best_diff_short = entry['short'] or get_best_diff_suffix(entry['value'])
-            history_lines.append(
-                f"{rank}   | {datetime.fromisoformat(entry['timestamp']).strftime('%d.%m.%Y %H:%M').ljust(20)} | "
-                f"{entry['value']} ({best_diff_short})          | {entry['hostname']}\n"
-            )
-        history_message = history_header
-        for line in history_lines:
-            if len(history_message) + len(line) + len(history_footer) > 1024:
-                break
-            history_message += line
-        history_message += history_footer
-        history_embed.add_field(name="🏆 Best-Difficulty Historie", value=history_message, inline=False)
+        history_embed.add_field(name="🏆 Best-Difficulty Historie", value=format_history_block(best_diff_history), inline=False)
     else:
         history_embed.add_field(name="🏆 Best-Difficulty Historie", value="Es gibt noch keine Best-Difficulty-Historie.", inline=False)
 
-    # Berechne verbleibende Zeit bis zum nächsten Update
-    try:
-        time_until_next_update = update_interval - (int(time.time()) % update_interval)
-        if time_until_next_update <= 0:
-            time_until_next_update = update_interval
-        minutes_left = time_until_next_update // 60
-        seconds_left = time_until_next_update % 60
-        next_update_time = f"⏳ Nächstes Update in {minutes_left}m {seconds_left}s"
-    except Exception:
-        next_update_time = f"⏳ Update-Intervall: {update_interval}s"
+    # Zum Zeitpunkt eines Updates ist das nächste genau ein Intervall entfernt; der Text bleibt
+    # dadurch von Tick zu Tick gleich und unveränderte Embeds müssen nicht neu gesendet werden
+    minutes_left, seconds_left = divmod(update_interval, 60)
+    next_update_time = f"⏳ Nächstes Update in {minutes_left}m {seconds_left}s"
 
     # Footer mit Restzeit zur nächsten Aktualisierung und Version
     version = get_version()
@@ -592,4 +690,4 @@ async def format_status_embeds():
         "bitaxe": bitaxe_embed,
         "nerdaxe": nerdaxe_embed,
         "history": history_embed,
-    }, new_record, new_record_value
+    }, new_record_device, new_record_value
@@ -4,21 +4,19 @@ Run with: pytest tests/test_config.py -v
 """
 
 import os
-import sys
 import tempfile
 import pytest
 from unittest.mock import patch, MagicMock
 from configparser import ConfigParser
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from config import (
     Config,
     get_bot_token,
     get_channel_id,
     get_update_interval,
     get_devices,
+    get_device_thresholds,
+    clear_config_cache,
     DEFAULT_TEMP_THRESHOLDS,
     DEFAULT_UPDATE_INTERVAL
 )
@@ -75,14 +73,33 @@ class TestConfig:
             assert 'miner1' in devices
             assert devices['miner1']['ip'] == '192.168.1.100'
             assert devices['miner1']['temp_thresholds'] == '55,60,65'
+            assert devices['miner1']['status_url'] == 'http://192.168.1.100/api/system/info'
             
             assert 'miner2' in devices
             assert devices['miner2']['ip'] == '192.168.1.101'
+    
+    def test_get_devices_cached_until_reload(self):
+        """Test get_devices() reuses its result until reload() is called."""
+        with patch.dict(os.environ, {'DEVICE_MINER1_IP': '192.168.1.100'}, clear=True):
+            config = Config()
+            devices = config.get_devices()
+            assert config.get_devices() is devices
+        
+        with patch.dict(os.environ, {'DEVICE_MINER2_IP': '192.168.1.101'}, clear=True):
+            assert 'miner2' not in config.get_devices()
+            config.reload()
+            devices = config.get_devices()
+            assert 'miner1' not in devices
+            assert devices['miner2']['ip'] == '192.168.1.101'
 
 
 class TestConfigHelpers:
     """Test cases for config helper functions."""
     
+    def setup_method(self):
+        """Reset memoized settings so each test sees its patched environment."""
+        clear_config_cache()
+    
     def test_get_bot_token_from_env(self):
         """Test get_bot_token() from environment."""
         with patch.dict(os.environ, {'DISCORD_BOT_TOKEN': 'test_token_123'}):
@@ -95,6 +112,15 @@ class TestConfigHelpers:
             channel_id = get_channel_id()
             assert channel_id == 123456789
     
+    def test_bot_settings_are_memoized(self):
+        """Test that bot settings are read once until the cache is cleared."""
+        with patch.dict(os.environ, {'DISCORD_BOT_TOKEN': 'first_token'}):
+            assert get_bot_token() == 'first_token'
+        with patch.dict(os.environ, {'DISCORD_BOT_TOKEN': 'second_token'}):
+            assert get_bot_token() == 'first_token'
+            clear_config_cache()
+            assert get_bot_token() == 'second_token'
+    
     def test_get_update_interval_default(self):
         """Test that DEFAULT_UPDATE_INTERVAL constant is defined correctly."""
         # This test verifies the default constant rather than runtime behavior
@@ -102,6 +128,22 @@ class TestConfigHelpers:
         assert DEFAULT_UPDATE_INTERVAL == 30
         assert isinstance(DEFAULT_UPDATE_INTERVAL, int)
     
+    def test_get_device_thresholds_parsed_once(self):
+        """Test get_device_thresholds() parses config strings into cached tuples."""
+        env_vars = {
+            'DEVICE_MINER1_IP': '192.168.1.100',
+            'DEVICE_MINER1_TEMP_THRESHOLDS': '55,60,65',
+            'DEVICE_MINER1_FAN_THRESHOLDS': 'fast,faster',
+        }
+        with patch.dict(os.environ, env_vars, clear=True):
+            clear_config_cache()
+            thresholds = get_device_thresholds('miner1')
+            assert thresholds['temp_thresholds'] == (55, 60, 65)
+            assert thresholds['volt_thresholds'] == (0.95, 1.1, 1.3)
+            # Invalid values fall back to the defaults
+            assert thresholds['fan_thresholds'] == (0, 2000, 3500, 7500)
+            assert get_device_thresholds('miner1') is thresholds
+    
     def test_get_devices_empty(self):
         """Test get_devices() with no configuration."""
         with patch.dict(os.environ, {}, clear=True):
@@ -141,6 +183,49 @@ class TestConfigFile:
             token = config.get('Bot', 'token')
             assert token == 'test_bot_token'
     
+    def test_missing_keys_use_fallback(self, mock_config_file):
+        """Test that missing sections, missing keys and bad integers return the fallback."""
+        with patch('config.os.path.join', return_value=str(mock_config_file)):
+            config = Config()
+            assert config.get('Missing', 'token', fallback='default') == 'default'
+            assert config.get('Bot', 'missing', fallback='default') == 'default'
+            assert config.getint('Bot', 'token', fallback=7) == 7
+            assert config.getint('Bot', 'update_interval', fallback=7) == 60
+    
+    def test_devices_memoized_while_file_unchanged(self, mock_config_file):
+        """Test that repeated get_devices() calls do not rebuild the devices."""
+        with patch('config.os.path.join', return_value=str(mock_config_file)):
+            with patch.dict(os.environ, {}, clear=True):
+                config = Config()
+                with patch('config._config', config), \
+                        patch.object(config, '_build_devices', wraps=config._build_devices) as build:
+                    devices = get_devices()
+                    for _ in range(5):
+                        assert get_devices() is devices
+                    assert build.call_count == 1
+    
+    def test_devices_reloaded_when_file_changes(self, mock_config_file):
+        """Test that a modified config.ini invalidates the cached devices."""
+        with patch('config.os.path.join', return_value=str(mock_config_file)):
+            with patch.dict(os.environ, {}, clear=True):
+                config = Config()
+                devices = config.get_devices()
+                assert list(devices) == ['TestDevice']
+                assert not config.refresh_if_changed()
+                
+                parser = ConfigParser()
+                parser.read(mock_config_file)
+                parser['SecondDevice'] = {'ip': '192.168.1.51'}
+                with open(mock_config_file, 'w') as f:
+                    parser.write(f)
+                mtime_ns = os.stat(mock_config_file).st_mtime_ns + 1_000_000_000
+                os.utime(mock_config_file, ns=(mtime_ns, mtime_ns))
+                
+                assert config.refresh_if_changed()
+                devices = config.get_devices()
+                assert devices['SecondDevice']['ip'] == '192.168.1.51'
+                assert config.get_devices() is devices
+    
     def test_env_overrides_config_file(self, mock_config_file):
         """Test that environment variables override config file."""
         with patch('config.os.path.join', return_value=str(mock_config_file)):
@@ -3,90 +3,142 @@
 Run with: pytest tests/test_device_status.py -v
 """
 
-import os
-import sys
+import time
 import pytest
 import asyncio
-from unittest.mock import patch, MagicMock, AsyncMock
-from datetime import datetime, timedelta
-
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+import json
+from unittest.mock import patch, AsyncMock
 
 from device_status import (
     fetch_status,
     get_all_device_statuses,
     get_value,
     unify_status,
+    clear_status_cache,
     STATUS_CACHE,
-    CACHE_TTL
+    CACHE_TTL,
+    CACHE_STALE_TTL,
+    ERROR_CACHE_TTL
 )
+from config import get_update_interval
 
 
 class TestGetValue:
     """Test cases for get_value() function."""
     
-    def test_get_value_simple(self):
-        """Test getting a simple value."""
-        data = {'temp': 65, 'voltage': 5.0}
-        result = get_value(data, ['temp'])
-        assert result == 65
-    
-    def test_get_value_alternatives(self):
-        """Test trying multiple alternative keys."""
-        data = {'power': 12.5}
-        result = get_value(data, ['voltage', 'power'])
-        assert result == 12.5
-    
-    def test_get_value_nested(self):
-        """Test getting nested value."""
-        data = {'stratum': {'poolMode': 'solo', 'url': 'pool.example.com'}}
-        result = get_value(data, ['stratum', 'poolMode'])
-        assert result == 'solo'
-    
-    def test_get_value_missing(self):
-        """Test getting non-existent value."""
-        data = {'temp': 65}
-        result = get_value(data, ['voltage'])
-        assert result is None
-    
-    def test_get_value_empty_keys(self):
-        """Test with empty keys list."""
-        data = {'temp': 65}
-        result = get_value(data, [])
-        assert result is None
-    
-    def test_get_value_nested_missing(self):
-        """Test nested path with missing intermediate key."""
-        data = {'stratum': {'poolMode': 'solo'}}
-        result = get_value(data, ['stratum', 'nonexistent'])
-        assert result is None
+    @pytest.mark.parametrize("data,keys,expected", [
+        # Simple value
+        ({'temp': 65, 'voltage': 5.0}, ['temp'], 65),
+        # Multiple alternative keys
+        ({'power': 12.5}, ['voltage', 'power'], 12.5),
+        # Nested value
+        ({'stratum': {'poolMode': 'solo', 'url': 'pool.example.com'}}, ['stratum', 'poolMode'], 'solo'),
+        # Keys passed as a tuple
+        ({'stratum': {'poolMode': 'solo'}}, ('stratum', 'poolMode'), 'solo'),
+        ({'hostip': '10.0.0.2'}, ('ip', 'hostip'), '10.0.0.2'),
+        # Non-existent value
+        ({'temp': 65}, ['voltage'], None),
+        # Empty keys list
+        ({'temp': 65}, [], None),
+        # Nested path with missing intermediate key
+        ({'stratum': {'poolMode': 'solo'}}, ['stratum', 'nonexistent'], None),
+    ])
+    def test_get_value(self, data, keys, expected):
+        """Test simple, alternative and nested lookups."""
+        assert get_value(data, keys) == expected
+
+
+class _FakeResponse:
+    """Minimal stand-in for an aiohttp response used as an async context manager."""
+    
+    def __init__(self, payload=None, error=None):
+        self._payload = payload
+        self._error = error
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return False
+    
+    async def read(self):
+        if self._error is not None:
+            raise self._error
+        if isinstance(self._payload, bytes):
+            return self._payload
+        return json.dumps(self._payload).encode()
+
+
+class _FakeSession:
+    """Minimal stand-in for aiohttp.ClientSession that records requested URLs."""
+    
+    closed = False
+    
+    def __init__(self, response):
+        self.response = response
+        self.urls = []
+    
+    def get(self, url):
+        self.urls.append(url)
+        return self.response
+
+
+DEVICE_URL = 'http://192.168.1.100/api/system/info'
+
+# Responses are read-only, so one canned instance is shared by the tests
+_CANNED_RESPONSE = _FakeResponse({'ASICModel': 'BM1397'})
 
 
 class TestFetchStatus:
     """Test cases for fetch_status() function."""
     
-    @pytest.mark.asyncio
     async def test_fetch_status_success(self):
         """Test successful status fetch."""
-        mock_response = AsyncMock()
-        mock_response.json = AsyncMock(return_value={'ASICModel': 'BM1397'})
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock()
-        
-        mock_session = AsyncMock()
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock()
-        mock_session.get = MagicMock(return_value=mock_response)
-        
-        with patch('src.device_status.aiohttp.ClientSession', return_value=mock_session):
-            result = await fetch_status('192.168.1.100')
+        session = _FakeSession(_CANNED_RESPONSE)
+        
+        with patch('device_status._session', None), \
+                patch('src.device_status.aiohttp.TCPConnector'), \
+                patch('src.device_status.aiohttp.ClientSession', return_value=session) as mock_session_cls:
+            result = await fetch_status(DEVICE_URL)
             assert result == {'ASICModel': 'BM1397'}
+            
+            # Second fetch reuses the shared session
+            await fetch_status(DEVICE_URL)
+            assert mock_session_cls.call_count == 1
+            assert session.urls == [DEVICE_URL] * 2
+    
+    async def test_fetch_status_decodes_like_stdlib_json(self):
+        """Test that the decoded response matches the stdlib json module."""
+        body = json.dumps({
+            'ASICModel': 'BM1368',
+            'hashRate': 1234.5678,
+            'bestDiff': '4.29G',
+            'sharesRejectedReasons': [{'message': 'Above target', 'count': 3}],
+            'stratum': {'poolMode': 'solo', 'usingFallback': False},
+            'ssid': 'Wohnzimmer-WLAN äöü',
+        }).encode()
+        
+        with patch('device_status._get_session', return_value=_FakeSession(_FakeResponse(body))):
+            result = await fetch_status(DEVICE_URL)
+        
+        assert result == json.loads(body)
+    
+    async def test_fetch_status_invalid_json_raises(self):
+        """Test that a malformed body raises ValueError."""
+        with patch('device_status._get_session', return_value=_FakeSession(_FakeResponse(b'<html>'))):
+            with pytest.raises(ValueError):
+                await fetch_status(DEVICE_URL)
+    
+    async def test_fetch_status_timeout_propagates(self):
+        """Test that a timeout is raised to the caller."""
+        session = _FakeSession(_FakeResponse(error=asyncio.TimeoutError()))
+        
+        with patch('device_status._get_session', return_value=session):
+            with pytest.raises(asyncio.TimeoutError):
+                await fetch_status(DEVICE_URL)
     
-    # Note: Testing error cases with aiohttp is complex due to async context manager mocking
-    # The error handling code is present in fetch_status() and works in production
-    # Error paths: asyncio.TimeoutError, aiohttp.ClientError, and general Exception
-    # all return {"error": <error_message>} as expected
+    # Note: get_all_device_statuses() turns the errors fetch_status() raises
+    # into {"error": <error_message>} entries (see TestCaching)
 
 
 class TestUnifyStatus:
@@ -135,11 +187,9 @@ class TestUnifyStatus:
 class TestCaching:
     """Test cases for status caching."""
     
-    @pytest.mark.asyncio
     async def test_cache_reduces_requests(self):
         """Test that caching reduces API requests."""
-        global STATUS_CACHE
-        STATUS_CACHE.clear()
+        clear_status_cache()
         
         mock_devices = {
             'device1': {'ip': '192.168.1.100'}
@@ -159,11 +209,9 @@ class TestCaching:
                 
                 assert result1 == result2
     
-    @pytest.mark.asyncio
     async def test_cache_expires(self):
         """Test that cache expires after TTL."""
-        global STATUS_CACHE
-        STATUS_CACHE.clear()
+        clear_status_cache()
         
         mock_devices = {
             'device1': {'ip': '192.168.1.100'}
@@ -177,13 +225,201 @@ class TestCaching:
                 await get_all_device_statuses()
                 assert mock_fetch.call_count == 1
                 
-                # Expire the cache
+                # Expire the cache (past the stale-while-revalidate window too)
                 if 'device1' in STATUS_CACHE:
-                    STATUS_CACHE['device1']['timestamp'] = datetime.now() - CACHE_TTL - timedelta(seconds=1)
+                    data, timestamp = STATUS_CACHE['device1']
+                    STATUS_CACHE['device1'] = (data, timestamp - CACHE_STALE_TTL - 1)
                 
                 # Second call should fetch again
                 await get_all_device_statuses()
                 assert mock_fetch.call_count == 2
+    
+    async def test_stale_while_revalidate(self):
+        """Test that a stale entry is served immediately and refreshed in the background."""
+        clear_status_cache()
+        
+        mock_devices = {'device1': {'ip': '192.168.1.100'}}
+        
+        with patch('device_status.get_devices', return_value=mock_devices):
+            with patch('device_status.fetch_status', new_callable=AsyncMock,
+                       side_effect=[{'temp': 65}, {'temp': 70}]) as mock_fetch:
+                await get_all_device_statuses()
+                
+                # Age the entry into the stale window
+                data, timestamp = STATUS_CACHE['device1']
+                STATUS_CACHE['device1'] = (data, timestamp - CACHE_TTL - 0.5)
+                
+                result = await get_all_device_statuses()
+                assert result['device1']['temp'] == 65  # stale data, not awaited
+                
+                # A second caller does not start another refresh
+                await get_all_device_statuses()
+                
+                await asyncio.sleep(0)
+                await asyncio.sleep(0)
+                assert mock_fetch.call_count == 2
+                assert result['device1']['temp'] == 70
+    
+    async def test_healthy_entry_from_previous_tick_is_refetched(self):
+        """Test that the update loop gets fresh data, not the previous tick's status."""
+        clear_status_cache()
+        
+        mock_devices = {'device1': {'ip': '192.168.1.100'}}
+        
+        with patch('device_status.get_devices', return_value=mock_devices):
+            with patch('device_status.fetch_status', new_callable=AsyncMock,
+                       side_effect=[{'temp': 65}, {'temp': 70}]) as mock_fetch:
+                await get_all_device_statuses()
+                
+                # Age the entry like the update loop does between two ticks
+                data, timestamp = STATUS_CACHE['device1']
+                STATUS_CACHE['device1'] = (data, timestamp - get_update_interval())
+                
+                result = await get_all_device_statuses()
+                assert mock_fetch.call_count == 2
+                assert result['device1']['temp'] == 70
+    
+    async def test_offline_device_does_not_block_poll(self):
+        """Test that a tick does not wait for the timeout of a device that was offline last tick."""
+        clear_status_cache()
+        
+        mock_devices = {'device1': {'ip': '192.168.1.100'}}
+        timeout_reached = asyncio.Event()
+        
+        async def fetch(url):
+            if mock_fetch.call_count > 1:
+                await timeout_reached.wait()  # device still down, the request hangs until its timeout
+            raise asyncio.TimeoutError()
+        
+        with patch('device_status.get_devices', return_value=mock_devices):
+            with patch('device_status.fetch_status', side_effect=fetch) as mock_fetch:
+                await get_all_device_statuses()
+                
+                data, timestamp = STATUS_CACHE['device1']
+                STATUS_CACHE['device1'] = (data, timestamp - get_update_interval())
+                
+                result = await asyncio.wait_for(get_all_device_statuses(), timeout=1)
+                assert result['device1'] == {'error': 'timeout'}
+                assert mock_fetch.call_count == 2
+            
+            # Let the hanging background fetch time out; its result is dropped after clearing
+            clear_status_cache()
+            timeout_reached.set()
+            await asyncio.sleep(0)
+    
+    async def test_error_cached_short_ttl(self):
+        """Test that error entries are refreshed after ERROR_CACHE_TTL, successes only after CACHE_TTL."""
+        clear_status_cache()
+        
+        mock_devices = {
+            'device1': {'ip': '192.168.1.100'},
+            'device2': {'ip': '192.168.1.101'},
+        }
+        
+        async def fetch(url):
+            if url == DEVICE_URL:
+                raise asyncio.TimeoutError()
+            return {'temp': 65}
+        
+        with patch('device_status.get_devices', return_value=mock_devices):
+            with patch('device_status.fetch_status', side_effect=fetch) as mock_fetch:
+                await get_all_device_statuses()
+                
+                # A repeated poll is served from the cache, errors included
+                await get_all_device_statuses()
+                assert mock_fetch.call_count == 2
+                
+                # Age both entries past ERROR_CACHE_TTL but not past CACHE_TTL
+                for name in mock_devices:
+                    data, timestamp = STATUS_CACHE[name]
+                    STATUS_CACHE[name] = (data, timestamp - ERROR_CACHE_TTL - 0.1)
+                
+                await get_all_device_statuses()
+                await asyncio.sleep(0)
+                await asyncio.sleep(0)
+                assert mock_fetch.call_count == 3
+                assert mock_fetch.call_args.args == (DEVICE_URL,)
+    
+    async def test_devices_fetched_concurrently(self):
+        """Test that cache misses are fetched in parallel, not one after another."""
+        clear_status_cache()
+        
+        mock_devices = {f'device{i}': {'ip': f'192.168.1.{100 + i}'} for i in range(5)}
+        
+        async def slow_fetch(url):
+            await asyncio.sleep(0.05)
+            return {'ip': url}
+        
+        with patch('device_status.get_devices', return_value=mock_devices):
+            with patch('device_status.fetch_status', side_effect=slow_fetch):
+                started = time.monotonic()
+                result = await get_all_device_statuses()
+                elapsed = time.monotonic() - started
+        
+        assert len(result) == 5
+        assert elapsed < 0.2  # sequential fetches would take at least 0.25 s
+    
+    async def test_coalesces_concurrent_misses(self):
+        """Test that concurrent callers share one fetch per device."""
+        clear_status_cache()
+        
+        mock_devices = {'device1': {'ip': '192.168.1.100'}}
+        
+        async def slow_fetch(url):
+            await asyncio.sleep(0.01)
+            return {'temp': 65}
+        
+        with patch('device_status.get_devices', return_value=mock_devices):
+            with patch('device_status.fetch_status', side_effect=slow_fetch) as mock_fetch:
+                results = await asyncio.gather(*(get_all_device_statuses() for _ in range(5)))
+        
+        assert mock_fetch.call_count == 1
+        assert all(result['device1']['temp'] == 65 for result in results)
+    
+    async def test_fetches_configured_status_url(self):
+        """Test that the status URL precomputed in the device config is requested."""
+        clear_status_cache()
+        
+        mock_devices = {'device1': {'ip': '192.168.1.100', 'status_url': 'http://miner.local/api/system/info'}}
+        
+        with patch('device_status.get_devices', return_value=mock_devices):
+            with patch('device_status.fetch_status', new_callable=AsyncMock, return_value={'temp': 65}) as mock_fetch:
+                await get_all_device_statuses()
+        
+        mock_fetch.assert_called_once_with('http://miner.local/api/system/info')
+    
+    async def test_statuses_returned_as_live_read_only_view(self):
+        """Test that callers get the same read-only mapping on every call."""
+        clear_status_cache()
+        
+        mock_devices = {'device1': {'ip': '192.168.1.100'}}
+        
+        with patch('device_status.get_devices', return_value=mock_devices):
+            with patch('device_status.fetch_status', new_callable=AsyncMock, return_value={'temp': 65}):
+                result1 = await get_all_device_statuses()
+                result2 = await get_all_device_statuses()
+        
+        assert result1 is result2
+        assert result1['device1']['temp'] == 65
+        with pytest.raises(TypeError):
+            result1['device2'] = {}
+    
+    async def test_fetch_errors_become_error_status(self):
+        """Test that fetch exceptions are stored as error entries."""
+        clear_status_cache()
+        
+        mock_devices = {
+            'device1': {'ip': '192.168.1.100'},
+            'device2': {'ip': '192.168.1.101'},
+        }
+        
+        with patch('device_status.get_devices', return_value=mock_devices):
+            with patch('device_status.fetch_status', new_callable=AsyncMock,
+                       side_effect=[asyncio.TimeoutError(), {'ASICModel': 'BM1397'}]):
+                result = await get_all_device_statuses()
+        
+        assert result['device1'] == {'error': 'timeout'}
+        assert result['device2']['ASICModel'] == 'BM1397'
 
 
 if __name__ == '__main__':
@@ -0,0 +1,148 @@
+"""Unit tests for status_overview module.
+
+Run with: pytest tests/test_status_overview.py -v
+"""
+
+import json
+import os
+import stat
+import pytest
+from unittest.mock import patch
+
+import status_overview
+from status_overview import (
+    flush_best_diff,
+    format_best_diff,
+    format_history_block,
+    format_record_block,
+    get_best_diff_suffix,
+    load_best_diff,
+    parse_best_diff,
+    save_best_diff,
+    _write_json_file,
+)
+
+
+class TestBestDiffSuffix:
+    """Test cases for best difficulty suffix handling."""
+    
+    @pytest.mark.parametrize("best_diff,suffix,value", [
+        ('512K', 'K', 512_000),
+        ('1.2M', 'M', 1_200_000),
+        ('4.35G', 'G', 4_350_000_000),
+        ('1.2T', 'T', 1_200_000_000_000),
+        ('1.2t', 'T', 1_200_000_000_000),
+        ('12345', '', 12345),
+    ])
+    def test_suffix_and_value(self, best_diff, suffix, value):
+        """Test that every parsed suffix is also detected."""
+        assert get_best_diff_suffix(best_diff) == suffix
+        assert parse_best_diff(best_diff) == value
+    
+    def test_format_best_diff_terahash(self):
+        """Test that a T value keeps its suffix when formatted."""
+        assert format_best_diff('1.2T') == '1,200,000,000,000 (T)'
+
+
+class TestSaveBestDiff:
+    """Test cases for save_best_diff()."""
+    
+    async def save(self, tmp_path, value, best_diff):
+        """Save a record and return the scheduled writes (path -> data)."""
+        writes = {}
+        with patch('status_overview.BEST_DIFF_FILE', str(tmp_path / 'best.json')), \
+                patch('status_overview.BEST_DIFF_HISTORY_FILE', str(tmp_path / 'history.json')), \
+                patch('status_overview._schedule_write', side_effect=writes.__setitem__):
+            await save_best_diff(value, best_diff, 'bitaxe-gamma')
+        return writes[str(tmp_path / 'best.json')], writes[str(tmp_path / 'history.json')]
+    
+    async def test_terahash_record(self, tmp_path):
+        """Test that a T record is stored and rendered with its suffix."""
+        record, history = await self.save(tmp_path, 1_200_000_000_000, '1.2T')
+        
+        assert record['value'] == 1_200_000_000_000
+        assert record['short'] == 'T'
+        assert history[0]['short'] == 'T'
+        assert '1,200,000,000,000 (T).' in format_record_block(record)
+        assert '1.2T (T)' in format_history_block(history)
+    
+    async def test_record_without_suffix(self, tmp_path):
+        """Test that a plain number is not labelled with a made-up suffix."""
+        record, _ = await self.save(tmp_path, 12345, '12345')
+        
+        assert record['short'] == ''
+        assert 'Wert      : 12,345.\n' in format_record_block(record)
+
+
+class TestWriteJsonFile:
+    """Test cases for the atomic JSON writer."""
+    
+    def test_keeps_mode_of_existing_file(self, tmp_path):
+        """Test that replacing a file keeps its permissions instead of the temp file's 0600."""
+        path = tmp_path / 'best.json'
+        path.write_text('{}')
+        os.chmod(path, 0o644)
+        
+        _write_json_file(str(path), {'value': 1})
+        
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o644
+        assert json.loads(path.read_text()) == {'value': 1}
+    
+    def test_new_file_is_world_readable(self, tmp_path):
+        """Test that a new file gets 0644, not the temp file's 0600."""
+        path = tmp_path / 'best.json'
+        _write_json_file(str(path), {'value': 1})
+        
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o644
+    
+    def test_failed_dump_leaves_no_temp_file(self, tmp_path):
+        """Test that a serialization error removes the temp file and keeps the old content."""
+        path = tmp_path / 'best.json'
+        path.write_text('{"value": 1}')
+        
+        with pytest.raises(TypeError):
+            _write_json_file(str(path), {'value': object()})
+        
+        assert os.listdir(tmp_path) == ['best.json']
+        assert json.loads(path.read_text()) == {'value': 1}
+
+
+class TestFlushBestDiff:
+    """Test cases for flush_best_diff()."""
+    
+    async def test_record_queued_during_write_is_written(self, tmp_path):
+        """Test that data queued while a write is in flight is written by the same flush."""
+        path = str(tmp_path / 'best.json')
+        write_json_file = status_overview._write_json_file
+        
+        def write_and_queue_newer(target, data):
+            if data == {'value': 1}:
+                status_overview._pending_writes[target] = {'value': 2}  # new record arrives meanwhile
+            return write_json_file(target, data)
+        
+        with patch.dict(status_overview._pending_writes, {path: {'value': 1}}, clear=True), \
+                patch('status_overview._write_json_file', side_effect=write_and_queue_newer):
+            assert await flush_best_diff()
+            assert status_overview._pending_writes == {}
+        
+        assert json.loads((tmp_path / 'best.json').read_text()) == {'value': 2}
+    
+    async def test_failed_write_stays_pending(self, tmp_path):
+        """Test that a failed write keeps the new record visible and is retried by the next flush."""
+        path = str(tmp_path / 'best.json')
+        record = {'value': 2, 'short': 'M', 'hostname': 'bitaxe-gamma', 'timestamp': '2026-01-01T00:00:00+00:00'}
+        
+        with patch('status_overview.BEST_DIFF_FILE', path), \
+                patch.dict(status_overview._pending_writes, {path: record}, clear=True):
+            with patch('status_overview._write_json_file', side_effect=OSError('disk full')):
+                assert not await flush_best_diff()
+            assert await load_best_diff() is record
+            
+            assert await flush_best_diff()
+            assert status_overview._pending_writes == {}
+        
+        assert json.loads((tmp_path / 'best.json').read_text()) == record
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])